@@ -0,0 +1,61 @@
+"""
+Startup cost of `import ezsgame` and `from ezsgame import *`, measured with `python -X importtime` in fresh interpreters.
+
+Usage (from the repository root):
+    python benchmarks/import_time.py [runs] [top]
+"""
+
+from statistics import median
+import os, subprocess, sys
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# the star import resolves every name of `ezsgame.__all__`, lazy resources in it would be imported after the package
+STATEMENTS = ("import ezsgame", "from ezsgame import *")
+
+# times the whole statement, `-X importtime` only reports the package import itself
+TIMED = "from time import perf_counter\nstart = perf_counter()\n{}\nprint(perf_counter() - start)"
+
+
+def measure(statement: str) -> tuple:
+    r"""
+    #### Runs the import `statement` in a new interpreter, returns its total time and the (self, cumulative) import time of every module (in microseconds)
+    """
+    env = dict(os.environ, PYTHONPATH=ROOT, PYGAME_HIDE_SUPPORT_PROMPT="1")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", TIMED.format(statement)],
+        env=env, capture_output=True, text=True, check=True,
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        self_time, cumulative, module = line[len("import time:"):].split("|")
+        times[module.strip()] = (int(self_time), int(cumulative))
+
+    return float(result.stdout) * 1e6, times
+
+
+def main(runs: int = 10, top: int = 15):
+    for statement in STATEMENTS:
+        samples = [measure(statement) for _ in range(runs)]
+
+        total = median(elapsed for elapsed, _ in samples)
+        pygame = median(s["pygame"][1] for _, s in samples if "pygame" in s)
+        modules = len([m for m in samples[0][1] if m.startswith("ezsgame")])
+        print(f"{statement}: {total / 1000:.1f}ms (median of {runs} runs, pygame: {pygame / 1000:.1f}ms, {modules} ezsgame modules)")
+
+    # slowest ezsgame modules by self time (star import)
+    modules = {m for _, s in samples for m in s if m.startswith("ezsgame")}
+    self_times = {m: median(s[m][0] for _, s in samples if m in s) for m in modules}
+
+    print(f"\n{'self (ms)':>10}  module")
+    for module, self_time in sorted(self_times.items(), key=lambda x: x[1], reverse=True)[:top]:
+        print(f"{self_time / 1000:>10.2f}  {module}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:3]))
@@ -0,0 +1,67 @@
+"""
+Cost of `TimeHandler.check` with many cooldown-like intervals: scanning every interval each frame (before) vs the heap (after).
+
+Usage (from the repository root):
+    python benchmarks/intervals.py [intervals] [frames]
+"""
+
+from random import Random
+from time import perf_counter
+import os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from ezsgame import TimeHandler
+
+
+FRAME = 16 # ms
+
+
+def scan_check(intervals, current_time):
+    # `TimeHandler.check` before the heap (every interval is compared every frame)
+    for interval in intervals:
+        if current_time - interval[0] >= interval[1]:
+            interval[2]()
+            interval[0] = current_time
+
+
+def main(count: int = 20000, frames: int = 600):
+    rng = Random(0)
+    periods = [rng.uniform(0.5, 5.0) for _ in range(count)] # seconds
+    calls = [0]
+
+    def callback():
+        calls[0] += 1
+
+    now = [0]
+    TimeHandler.get_ticks = lambda: now[0]
+
+    # before
+    intervals = [[0, period * 1000, callback] for period in periods]
+    start = perf_counter()
+    for frame in range(frames):
+        scan_check(intervals, frame * FRAME)
+    before = perf_counter() - start
+    before_calls, calls[0] = calls[0], 0
+
+    # after
+    for i, period in enumerate(periods):
+        TimeHandler.add(period, callback, f"cooldown.{i}")
+    TimeHandler.check()
+
+    start = perf_counter()
+    for frame in range(frames):
+        now[0] = frame * FRAME
+        TimeHandler.check()
+    after = perf_counter() - start
+
+    print(f"{count} intervals, {frames} frames")
+    print(f"scan : {before / frames * 1000:.3f}ms per frame ({before_calls} calls)")
+    print(f"heap : {after / frames * 1000:.3f}ms per frame ({calls[0]} calls)")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:3]))
@@ -0,0 +1,106 @@
+"""
+Cost of polling keys: `eval` based `to_pgkey` (before) vs the key table and `KeySet` (after).
+
+Usage (from the repository root):
+    python benchmarks/key_polling.py [iterations]
+"""
+
+from timeit import timeit
+import os, sys, tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame as pg
+from ezsgame import EventHandler, KeySet, is_down, to_pgkey
+
+
+KEYS = ("a", "d", "w", "s", "space", "left", "right", "enter")
+
+
+def eval_to_pgkey(key: str) -> int:
+    # `to_pgkey` before the key table
+    if key.lower() == "enter":
+        key = "RETURN"
+
+    elif len(key) > 1:
+        key = key.upper()
+
+    return eval("pg.K_" + key)
+
+
+def eval_is_down(key: str) -> bool:
+    return pg.key.get_pressed()[eval_to_pgkey(key)]
+
+
+def poll_before():
+    for key in KEYS:
+        if eval_is_down(key):
+            return True
+    return False
+
+
+def poll_after():
+    for key in KEYS:
+        if is_down(key):
+            return True
+    return False
+
+
+keyset = KeySet(*KEYS)
+
+def poll_keyset():
+    return keyset.any()
+
+
+def peak_allocation(func, runs: int = 1000) -> int:
+    r"""
+    #### Returns the peak memory (in bytes) allocated while calling `func`, minus the one of an empty function
+    `0` means the call doesn't allocate
+    """
+    func()
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    start = tracemalloc.get_traced_memory()[0]
+
+    for _ in range(runs):
+        func()
+
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    if func is _empty:
+        return peak - start
+
+    return max(0, peak - start - peak_allocation(_empty, runs))
+
+
+def _empty():
+    pass
+
+
+def main(iterations: int = 20000):
+    pg.init()
+    pg.display.set_mode((1, 1))
+    pg.event.pump()
+    EventHandler.pressed_keys = pg.key.get_pressed()
+
+    print(f"polling {len(KEYS)} keys, {iterations} iterations\n")
+    print(f"{'':<28} {'us/poll':>8} {'peak bytes':>12}")
+
+    for label, func in (
+        ("before (eval + get_pressed)", poll_before),
+        ("after (table)", poll_after),
+        ("after (KeySet.any)", poll_keyset),
+    ):
+        seconds = timeit(func, number=iterations)
+        print(f"{label:<28} {seconds / iterations * 1e6:>8.3f} {peak_allocation(func):>12}")
+
+    print(f"\nto_pgkey: eval {timeit(lambda: eval_to_pgkey('left'), number=iterations) / iterations * 1e6:.3f}us, "
+          f"table {timeit(lambda: to_pgkey('left'), number=iterations) / iterations * 1e6:.3f}us")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]))
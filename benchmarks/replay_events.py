@@ -0,0 +1,99 @@
+"""
+Event heavy scenario (inventory grid with hover/click listeners) played back from an input recording.
+
+If the recording doesn't exist, a synthetic one is written first (fast mouse sweeps, clicks and key presses),
+so the same input is replayed on every run.
+
+Usage (from the repository root):
+    python benchmarks/replay_events.py [recording] [frames]
+"""
+
+from random import Random
+import os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame as pg
+from ezsgame import EventHandler, InputRecorder, Rect, Replay, Window
+
+
+COLUMNS, ROWS, SLOT = 30, 20, 24
+
+
+def build_scene():
+    counters = {"hover": 0, "unhover": 0, "click": 0, "keys": 0}
+
+    def count(name):
+        def callback():
+            counters[name] += 1
+        return callback
+
+    for i in range(COLUMNS * ROWS):
+        slot = Rect(pos=((i % COLUMNS) * SLOT, (i // COLUMNS) * SLOT), size=(SLOT - 2, SLOT - 2))
+
+        EventHandler.add_event("hover", slot, count("hover"))
+        EventHandler.add_event("unhover", slot, count("unhover"))
+        EventHandler.add_event("click", slot, count("click"))
+
+    EventHandler.on_key("down", ["a", "d", "w", "s"], count("keys"))
+    return counters
+
+
+def record(window: Window, file: str, frames: int):
+    r"""
+    #### Writes a synthetic recording: every frame has a few mouse motions, some frames a click or a key press
+    """
+    rng = Random(0)
+    keys = (pg.K_a, pg.K_d, pg.K_w, pg.K_s)
+    x = y = 0
+
+    recorder = InputRecorder(file)
+    recorder.start()
+
+    for frame in range(frames):
+        for _ in range(rng.randint(5, 20)):
+            dx, dy = rng.randint(-15, 15), rng.randint(-15, 15)
+            x = min(max(x + dx, 0), COLUMNS * SLOT)
+            y = min(max(y + dy, 0), ROWS * SLOT)
+            pg.event.post(pg.event.Event(pg.MOUSEMOTION, pos=(x, y), rel=(dx, dy), buttons=(0, 0, 0)))
+
+        if frame % 10 == 0:
+            pg.event.post(pg.event.Event(pg.MOUSEBUTTONDOWN, pos=(x, y), button=1))
+            pg.event.post(pg.event.Event(pg.MOUSEBUTTONUP, pos=(x, y), button=1))
+
+        if frame % 7 == 0:
+            key = keys[frame % 4]
+            pg.event.post(pg.event.Event(pg.KEYDOWN, key=key, mod=0, scancode=0, unicode=""))
+            pg.event.post(pg.event.Event(pg.KEYUP, key=key, mod=0, scancode=0, unicode=""))
+
+        window.check_events()
+        window.update()
+
+    recorder.stop()
+
+
+def main(file: str = "benchmarks/events.ezsrec", frames: int = 600):
+    window = Window(size=(COLUMNS * SLOT, ROWS * SLOT), headless=True, fps=0)
+    counters = build_scene()
+
+    if not os.path.exists(file):
+        record(window, file, frames)
+        print(f"recorded {frames} frames into {file} ({os.path.getsize(file)} bytes)")
+
+        for name in counters:
+            counters[name] = 0
+
+    def loop():
+        while True:
+            window.check_events()
+            window.update()
+
+    print(Replay(file).run(loop))
+    print("callbacks:", counters)
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2], *map(int, sys.argv[2:3]))
@@ -0,0 +1,61 @@
+"""
+Cost of animating many properties: a Python `lerp` per tween and frame (before) vs the vectorized `Tweens` step (after).
+
+Usage (from the repository root):
+    python benchmarks/tweens.py [tweens] [frames]
+"""
+
+from time import perf_counter
+import os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from ezsgame import Clocks, Pos, Tweens
+
+
+FRAME = 1 / 60
+
+
+def lerp(start: float, end: float, time: float, duration: float) -> float:
+    # same as `utilities.math_utils.lerp` (its overload shadows it)
+    return start + (end - start) * (time / duration)
+
+
+def main(count: int = 10000, frames: int = 120):
+    duration = frames * FRAME * 2 # tweens are still running at the end
+
+    # before: per-object interpolation
+    targets = [Pos(0, 0) for _ in range(count)]
+    tweens = [(pos, (0.0, 0.0), (100.0 + i % 50, 50.0)) for i, pos in enumerate(targets)]
+
+    start = perf_counter()
+    for frame in range(1, frames + 1):
+        time = frame * FRAME
+        for pos, (sx, sy), (ex, ey) in tweens:
+            pos.x = lerp(sx, ex, time, duration)
+            pos.y = lerp(sy, ey, time, duration)
+    before = perf_counter() - start
+
+    # after: one vectorized step per frame
+    targets = [Pos(0, 0) for _ in range(count)]
+    for i, pos in enumerate(targets):
+        Tweens.start(pos, None, (100 + i % 50, 50), duration)
+
+    Clocks.manual = True
+
+    start = perf_counter()
+    for frame in range(frames):
+        Clocks.step(FRAME)
+        Clocks.update()
+    after = perf_counter() - start
+
+    print(f"{count} tweens, {frames} frames")
+    print(f"lerp   : {before / frames * 1000:.3f}ms per frame")
+    print(f"tweens : {after / frames * 1000:.3f}ms per frame")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:3]))
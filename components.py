@@ -67,22 +67,17 @@ class Selectable(Component):
         self.original_color = object.styles.color
 
     def activate(self) -> None:
-        @add_event("hover", self.object, name=self._hover_signal_name)
+        # hover/unhover are only called when the mouse enters/leaves the object
+        @add_event("hover", self.object, name=f"{self._hover_signal_name}.enter")
         def hover():
-            if self.is_hovered:
-                return
-
             self.object.styles.color = "green"
             self.object.styles.resolve(self.object.parent.size)
             self.hover_sound.play()
 
             self.is_hovered = True
 
-        @add_event("unhover", self.object, name=self._hover_signal_name)
+        @add_event("unhover", self.object, name=f"{self._hover_signal_name}.leave")
         def unhover():
-            if not self.is_hovered:
-                return
-
             self.is_hovered = False
             self.object.styles.color = self.original_color
             self.object.styles.resolve(self.object.parent.size)
@@ -94,5 +89,5 @@ class Selectable(Component):
             self.on_select()
 
     def deactivate(self) -> None:
-        remove_event(self._hover_signal_name)
+        remove_event(f"{self._hover_signal_name}.", prefix=True)
         remove_event(self._click_signal_name)
@@ -3,6 +3,8 @@ from .window import *
 from .objects import *
 from .event_handler import *
 from .time_handler import *
+from .clock import *
+from .actions import *
 from .world import *
 
 # Secondary Resources
@@ -15,10 +17,49 @@ from .types import *
 # Extras (Under Development)
 
 from .utilities import *
-from .graphics import *
 from .components import *
 
 from .styles.colors import *
 from .styles.style import *
-from . import camera
-from .scenes import *
+
+
+# Lazy resources, imported the first time they are accessed (`ezsgame.Sprite`, `ezsgame.camera`, ...)
+_LAZY = {
+    "Image": ".graphics",
+    "Sprite": ".graphics",
+    "AnimatedSprite": ".graphics",
+    "AnimatedSpriteRef": ".graphics",
+    "Scene": ".scenes",
+    "SceneManager": ".scenes",
+    "camera": ".camera",
+    "InputRecorder": ".replay",
+    "Replay": ".replay",
+    "ReplayFinished": ".replay",
+    "Tween": ".tweens",
+    "Tweens": ".tweens",
+    "tween": ".tweens",
+    "EASINGS": ".tweens",
+}
+
+def __getattr__(name: str):
+    # `DEFAULT_MIXER` is created on first access (see `sounds.get_default_mixer`)
+    if name == "DEFAULT_MIXER":
+        return get_default_mixer()
+
+    if name in _LAZY:
+        from importlib import import_module
+
+        module = import_module(_LAZY[name], __name__)
+        value = module if name == "camera" else getattr(module, name)
+
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+# lazy resources aren't exported by `from ezsgame import *` (it would import them), import them by name:
+# `from ezsgame import Sprite, Scene`, `ezsgame.DEFAULT_MIXER` or `get_default_mixer()`
+__all__ = [name for name in globals() if not name.startswith("_")]
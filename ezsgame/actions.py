@@ -0,0 +1,129 @@
+"""
+Module for input actions (named inputs bound to keys and mouse buttons, with pressed / held / released states)
+"""
+
+from typing import Dict, Iterable, Tuple
+from .types import Signal
+
+
+class Action:
+    r"""
+    #### Action
+    Named input bound to keys and/or mouse buttons, its state is updated once per frame by `Actions.update`.
+
+    - `held` : any of its keys/buttons is down
+    - `pressed` : `held` started this frame
+    - `released` : `held` ended this frame
+
+    Note: a key pressed and released between two frames is not seen (states are compared frame by frame)
+    """
+
+    __slots__ = ("name", "keys", "buttons", "codes", "held", "pressed", "released")
+
+    def __init__(self, name: str, keys: Iterable[str | int] = (), buttons: Iterable[int] = ()):
+        from .event_handler import to_pgkey
+
+        self.name: str = name
+        self.keys: Tuple = tuple(keys)
+        self.buttons: Tuple[int, ...] = tuple(buttons) # 1 left, 2 middle, 3 right, 4 and 5 extra buttons
+        self.codes: Tuple[int, ...] = tuple(to_pgkey(key) for key in self.keys)
+
+        self.held: bool = False
+        self.pressed: bool = False
+        self.released: bool = False
+
+    def _update(self, keys, buttons) -> None:
+        held = False
+
+        for code in self.codes:
+            if keys[code]:
+                held = True
+                break
+
+        else:
+            for button in self.buttons:
+                if buttons[button - 1]:
+                    held = True
+                    break
+
+        self.pressed = held and not self.held
+        self.released = self.held and not held
+        self.held = held
+
+    def __repr__(self) -> str:
+        return f"<Action: {self.name}, keys: {self.keys}, buttons: {self.buttons}>"
+
+
+class Actions:
+    r"""
+    #### Actions
+    Registry of input actions, states of all the actions are updated once per frame (by `EventHandler.check`)
+    from the key and mouse button states of the frame, so querying an action is O(1) and no event listeners are needed.
+
+    #### Example
+    ```python
+    Actions.bind("jump", keys=["space", "w"])
+    Actions.bind("shoot", buttons=[1])
+
+    def update():
+        if Actions.pressed("jump"):
+            ...
+    ```
+
+    - `on_update` : signal triggered after the actions are updated, before events are dispatched
+    """
+
+    actions: Dict[str, Action] = {}
+    on_update: Signal = Signal()
+
+    def bind(name: str, keys: Iterable[str | int] = (), buttons: Iterable[int] = ()) -> Action:
+        r"""
+        #### Creates an action (or replaces the binding of an existing one) and returns it
+        - `name` : name of the action
+        - `keys` : keys that trigger the action (names or key codes)
+        - `buttons` : mouse buttons that trigger the action (`1` left, `2` middle, `3` right)
+        """
+        action = Actions.actions[name] = Action(name, keys, buttons)
+        return action
+
+    def unbind(name: str) -> None:
+        r"""
+        #### Removes an action (does nothing if the action doesn't exist)
+        """
+        Actions.actions.pop(name, None)
+
+    def get(name: str) -> Action:
+        r"""
+        #### Returns an action by its name
+        """
+        return Actions.actions[name]
+
+    def pressed(name: str) -> bool:
+        r"""
+        #### Returns `True` if the action started this frame
+        """
+        return Actions.actions[name].pressed
+
+    def held(name: str) -> bool:
+        r"""
+        #### Returns `True` if the action is active
+        """
+        return Actions.actions[name].held
+
+    def released(name: str) -> bool:
+        r"""
+        #### Returns `True` if the action ended this frame
+        """
+        return Actions.actions[name].released
+
+    def update(keys, buttons) -> None:
+        r"""
+        #### Updates the state of every action, called once per frame by `EventHandler.check`
+        - `keys` : key states of the frame (`pg.key.get_pressed()`)
+        - `buttons` : mouse button states of the frame (`pg.mouse.get_pressed(5)`)
+        """
+        for action in Actions.actions.values():
+            action._update(keys, buttons)
+
+        if Actions.on_update.listeners:
+            Actions.on_update.trigger()
@@ -0,0 +1,168 @@
+"""
+Module for game time (time scale, pause, clock groups and simulated time)
+"""
+
+from time import perf_counter
+from typing import Dict, List
+from .types import Signal
+
+
+class Clock:
+    r"""
+    #### Clock
+    Game time of a group of things, advanced once per frame by its parent clock (see `Clocks`).
+
+    - `scale` : speed of the clock relative to its parent (`0.5` half speed, `2` double speed)
+    - `paused` : if True, the clock (and its children) doesn't advance
+    - `time` : seconds the clock has advanced since it was created
+    - `delta_time` : seconds the clock advanced in the last frame
+
+    #### Parameters
+    - `name` : name of the clock
+    - `parent` : clock this one follows, `None` for the root clock (Optional)
+    - `scale` : initial time scale (Optional)
+    """
+
+    __slots__ = ("name", "parent", "children", "scale", "paused", "time", "delta_time")
+
+    def __init__(self, name: str, parent: "Clock | None" = None, scale: float = 1.0):
+        self.name: str = name
+        self.parent: Clock | None = parent
+        self.children: List[Clock] = []
+
+        self.scale: float = scale
+        self.paused: bool = False
+
+        self.time: float = 0.0
+        self.delta_time: float = 0.0
+
+        if parent is not None:
+            parent.children.append(self)
+
+    def pause(self) -> None:
+        r"""
+        #### Stops the clock and its children
+        """
+        self.paused = True
+
+    def resume(self) -> None:
+        r"""
+        #### Resumes the clock
+        """
+        self.paused = False
+
+    def advance(self, delta_time: float) -> None:
+        r"""
+        #### Advances the clock and its children, called once per frame
+        - `delta_time` : seconds the parent clock advanced
+        """
+        delta_time = 0.0 if self.paused else delta_time * self.scale
+
+        self.delta_time = delta_time
+        self.time += delta_time
+
+        for child in self.children:
+            child.advance(delta_time)
+
+    def __repr__(self) -> str:
+        return f"<Clock: {self.name}, time: {self.time:.3f}, scale: {self.scale}, paused: {self.paused}>"
+
+
+class Clocks:
+    r"""
+    #### Clocks
+    Clocks of the game, advanced once per frame (by `TimeHandler.check`).
+
+    - `real` : advances with the frame time (the recorded one while replaying), never scaled or paused
+    - `main` : game time, read by `TimeHandler` (intervals and coroutines), `AnimatedSprite` and `window.get_delta_time`.
+      Set its `scale` to slow down or speed up the game, `pause` it to stop gameplay
+    - Groups `Clocks.add("ui", parent="real")` have their own scale and pause, e.g. UI animations that keep running while `main` is paused
+    - `step_size` : if set, every frame advances exactly `step_size` seconds (simulated time), with an uncapped headless window
+      the game runs as fast as possible, many times faster than real time
+    - `manual` : if True, frames only advance the time passed to `Clocks.step` since the last frame
+    - `on_update` : signal triggered after the clocks advanced (e.g. tweens are stepped there)
+
+    #### Example
+    ```python
+    Clocks.main.scale = 0.25 # slow motion
+
+    ui = Clocks.add("ui", parent="real")
+    Clocks.main.pause() # gameplay stops, `ui` keeps running
+    ```
+    """
+
+    real: Clock = Clock("real")
+    main: Clock = Clock("main", real)
+    groups: Dict[str, Clock] = {"real": real, "main": main}
+
+    step_size: float | None = None
+    manual: bool = False
+    on_update: Signal = Signal()
+
+    _pending: float = 0.0 # time passed to `step` (manual mode)
+    _last: float | None = None # `perf_counter` of the last frame
+
+    def add(name: str, parent: str = "main", scale: float = 1.0) -> Clock:
+        r"""
+        #### Creates a clock group and returns it
+        - `name` : name of the clock
+        - `parent` : name of the clock it follows (`"main"` by default, `"real"` to not be affected by the main clock)
+        - `scale` : time scale of the clock (Optional)
+        """
+        if name in Clocks.groups:
+            raise ValueError(f"Clock \"{name}\" already exists")
+
+        clock = Clocks.groups[name] = Clock(name, Clocks.groups[parent], scale)
+        return clock
+
+    def get(name: str) -> Clock:
+        r"""
+        #### Returns a clock by its name
+        """
+        return Clocks.groups[name]
+
+    def remove(name: str) -> None:
+        r"""
+        #### Removes a clock group (its children are removed too)
+        """
+        if name in ("real", "main"):
+            raise ValueError(f"Clock \"{name}\" can't be removed")
+
+        clock = Clocks.groups.pop(name)
+        clock.parent.children.remove(clock)
+
+        for child in list(clock.children):
+            Clocks.remove(child.name)
+
+    def step(seconds: float) -> None:
+        r"""
+        #### Manual mode: the next frame advances `seconds` (calls add up until the frame)
+        """
+        Clocks._pending += seconds
+
+    def update(delta_time: float | None = None) -> None:
+        r"""
+        #### Advances all the clocks, called once per frame by `TimeHandler.check`
+        - `delta_time` : frame time to use instead of the measured one (e.g. the recorded one while replaying) (Optional)
+        """
+        now = perf_counter()
+
+        if delta_time is None:
+            if Clocks.manual:
+                delta_time, Clocks._pending = Clocks._pending, 0.0
+
+            elif Clocks.step_size is not None:
+                delta_time = Clocks.step_size
+
+            # first frame
+            elif Clocks._last is None:
+                delta_time = 0.0
+
+            else:
+                delta_time = now - Clocks._last
+
+        Clocks._last = now
+        Clocks.real.advance(delta_time)
+
+        if Clocks.on_update.listeners:
+            Clocks.on_update.trigger()
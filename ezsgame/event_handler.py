@@ -1,22 +1,130 @@
-import random
-from typing import Iterable, List, Callable
+from itertools import count
+from typing import Dict, Iterable, List, Callable, Tuple
 import pygame as pg
 from .world import World
 from .objects import Object
+from .spatial import SpatialGrid
+from .actions import Actions
+
+
+# key name -> pygame key code, built once from the `pg.K_*` constants (`"a"`, `"LEFT"`, `"left"`, `"kp_enter"`, ...)
+KEYS: Dict[str, int] = {}
+
+for _name in dir(pg):
+    if _name.startswith("K_"):
+        KEYS[_name[2:]] = KEYS[_name[2:].lower()] = getattr(pg, _name)
+
+# other names for some keys
+KEY_ALIASES: Dict[str, str] = {
+    "enter": "return",
+    "esc": "escape",
+    "del": "delete",
+    "ins": "insert",
+    "spacebar": "space",
+    "pgup": "pageup",
+    "pgdown": "pagedown",
+    "ctrl": "lctrl",
+    "shift": "lshift",
+    "alt": "lalt",
+}
+
+for _alias, _name in KEY_ALIASES.items():
+    KEYS[_alias] = KEYS[_alias.upper()] = KEYS[_name]
+
+del _name, _alias
 
 
 def to_pgkey(key: str) -> int:
     '''
     #### Converts a key to a pygame key 
-    Example : `a` -> `pg.K_a`
+    Example : `a` -> `pg.K_a`, `enter` -> `pg.K_RETURN`
+    - `key` : key name (case insensitive) or alias (see `KEY_ALIASES`), key codes are returned as they are
     '''
-    if key.lower() == "enter":
-        key = "RETURN"
+    code = KEYS.get(key)
+
+    if code is None:
+        if isinstance(key, int):
+            return key
+
+        code = KEYS.get(key.lower())
+
+        if code is None:
+            raise ValueError(f"Unknown key: \"{key}\"")
+
+    return code
 
-    elif len(key) > 1:
-        key = key.upper()
 
-    return eval("pg.K_" + key)
+class KeySet:
+    r'''
+    #### Key Set
+    Group of keys converted to key codes once, to poll all of them at once.
+
+    #### Example
+    ```python
+    jump = KeySet("space", "w", "up")
+
+    if jump.any():
+        ...
+    ```
+    '''
+
+    __slots__ = ("names", "codes")
+
+    def __init__(self, *keys: str | int):
+        self.names = keys
+        self.codes = tuple(to_pgkey(key) for key in keys)
+
+    def any(self, pressed=None) -> bool:
+        r'''
+        #### Returns `True` if any of the keys is pressed
+        - `pressed` : key states to check (default: states of the current frame)
+        '''
+        if pressed is None:
+            pressed = EventHandler.pressed_keys or pg.key.get_pressed()
+
+        for code in self.codes:
+            if pressed[code]:
+                return True
+
+        return False
+
+    def all(self, pressed=None) -> bool:
+        r'''
+        #### Returns `True` if all the keys are pressed
+        - `pressed` : key states to check (default: states of the current frame)
+        '''
+        if pressed is None:
+            pressed = EventHandler.pressed_keys or pg.key.get_pressed()
+
+        for code in self.codes:
+            if not pressed[code]:
+                return False
+
+        return True
+
+    def count(self, pressed=None) -> int:
+        r'''
+        #### Returns how many of the keys are pressed
+        - `pressed` : key states to check (default: states of the current frame)
+        '''
+        if pressed is None:
+            pressed = EventHandler.pressed_keys or pg.key.get_pressed()
+
+        total = 0
+        for code in self.codes:
+            if pressed[code]:
+                total += 1
+
+        return total
+
+    def __contains__(self, key: str | int) -> bool:
+        return to_pgkey(key) in self.codes
+
+    def __iter__(self):
+        return iter(self.codes)
+
+    def __len__(self) -> int:
+        return len(self.codes)
 
 class Event:
     __slot__ = "event_type", "event_name", "callback", "object", "name"
@@ -27,6 +135,7 @@ class Event:
         self.callback = callback
         self.object = object
         self.name = name
+        self.raw = False # gets every event even if events are coalesced
 
         for k, v in kwargs.items():
             setattr(self, k, v)
@@ -40,9 +149,154 @@ class Event:
         except Exception as e:
             self.callback()
 
-class EventList(list):    
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+# how a listener is called once its event is routed to it
+_CALL = 0 # listeners (objects) need to be hovered and visible, base events are just called
+_PLAIN = 1 # callback is called without checking visibility
+_KEYED = 2 # called with `key` and `unicode`
+
+# hover transitions, object listeners of these events are called when the mouse enters/leaves the object
+_HOVER_EVENTS = {
+    "hover": "enter",
+    "mouseenter": "enter",
+    "unhover": "leave",
+    "mouseleave": "leave",
+}
+
+# events that can be coalesced (see `EventHandler.coalesce`)
+_COALESCED_TYPES = frozenset((pg.MOUSEMOTION, pg.MOUSEWHEEL))
+
+# mouse button of each `MOUSEBUTTONDOWN` event name
+_BUTTONS = {
+    "mousewheelup": 4,
+    "mousewheeldown": 5,
+    "rightclick": 3,
+    "click": 1,
+    "mousedown": 1,
+    "leftclick": 1,
+}
+
+def _split(items: List[Tuple[Event, int]]) -> Tuple[Dict[Object, List[Tuple[Event, int]]], List[Tuple[Event, int]]]:
+    # (listeners by object, base listeners)
+    by_object = {}
+    base = []
+
+    for item in items:
+        if item[0].object is not None:
+            by_object.setdefault(item[0].object, []).append(item)
+        else:
+            base.append(item)
+
+    return by_object, base
+
+def _group(name: str) -> str | None:
+    # first segment of a name, with the `.` (`None` if the name has no `.`)
+    index = name.find(".")
+    return name[: index + 1] if index != -1 else None
+
+class EventList:
+    r"""
+    #### Event List
+    Event listeners indexed by name (in the order they were added), adding, replacing and removing a listener is O(1)
+    - Names are also grouped by their first segment (up to the first `.`), so removing a prefix like `"140234."` only visits
+      the names of that group (default names of object listeners start with `id(object)`, see `EventHandler.add_event`)
+    """
+
+    def __init__(self, events: Iterable[Event] = ()):
+        self._events: Dict[str, Event] = {}
+        self._groups: Dict[str, Dict[str, None]] = {} # first segment of the name (with the `.`) : names
+        self._routes = None
+        self.objects: List[Object] = [] # objects with listeners, updated with the dispatch table
+
+        for event in events:
+            self.add(event)
+
+    def __iter__(self):
+        return iter(self._events.values())
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._events
+
+    def get_routes(self) -> Dict[int | str, Tuple[Dict[int, List[Tuple[Event, int]]], List[Tuple[Event, int]]]]:
+        r"""
+        #### Returns the dispatch table, rebuilt only if the list changed since the last call
+        `{event_type : ({button or key : listeners}, listeners), ...}`
+        - The first item routes events by `ev.button` (`MOUSEBUTTONDOWN`) or `ev.key` (`KEYDOWN`, `KEYUP`),
+          the second one is used for any other button/key and for the rest of event types
+        - `listeners` are `({object : [(event, call_mode), ...]}, [(event, call_mode), ...])`, listeners of objects by object
+          (dispatched by z-index) and base listeners (custom events keep a plain list)
+        """
+        if self._routes is None:
+            self._routes = self._build_routes()
+
+        return self._routes
+
+    def _build_routes(self):
+        routes = {}
+
+        # keys with listeners of their own
+        keys = {}
+        for event in self:
+            if "keys" in event:
+                keys.setdefault(event.type, set()).update(event.keys)
+
+        self.objects = list({id(event.object): event.object for event in self if event.object is not None}.values())
+
+        for event in self:
+            by_code, default = routes.setdefault(event.type, ({}, []))
+
+            if event.type == pg.MOUSEBUTTONDOWN:
+                button = _BUTTONS.get(event.event_name)
+
+                # other names don't match any button
+                if button is not None:
+                    by_code.setdefault(button, []).append((event, _CALL))
+
+            elif event.type == pg.MOUSEMOTION:
+                # hover state transitions of objects (see `EventHandler.update_hover`)
+                if event.object is not None and event.event_name in _HOVER_EVENTS:
+                    transitions = routes.setdefault(_HOVER_EVENTS[event.event_name], {})
+                    transitions.setdefault(event.object, []).append(event)
+
+                else:
+                    default.append((event, _CALL))
+
+            elif event.type == pg.MOUSEBUTTONUP:
+                default.append((event, _PLAIN))
+
+            elif "keys" in event:
+                for key in event.keys:
+                    by_code.setdefault(key, []).append((event, _KEYED))
+
+            elif event.type in (pg.KEYDOWN, pg.KEYUP):
+                default.append((event, _KEYED))
+
+                # listeners of any key are also called for keys with listeners of their own (in the order they were added)
+                for key in keys.get(event.type, ()):
+                    by_code.setdefault(key, []).append((event, _KEYED))
+
+            else:
+                default.append((event, _CALL))
+
+        # when events are coalesced, listeners get the coalesced event unless they asked for every event (`raw`)
+        for event_type in _COALESCED_TYPES:
+            if event_type in routes:
+                default = routes[event_type][1]
+
+                routes[("coalesced", event_type)] = ({}, [item for item in default if not item[0].raw])
+                routes[("raw", event_type)] = ({}, [item for item in default if item[0].raw])
+
+        # listeners of objects are grouped by object, so only the objects under the mouse are visited
+        for route_type, route in routes.items():
+            if route_type in ("custom", "enter", "leave"):
+                continue
+
+            by_code, default = route
+            routes[route_type] = ({code: _split(items) for code, items in by_code.items()}, _split(default))
+
+        return routes
 
     def get_by_type(self, event_type) -> List[Event]:
         return [event for event in self if event.type == event_type]
@@ -51,62 +305,154 @@ class EventList(list):
         lst = [event for event in self if event.event_name == event_name]
         return lst[0] if lst else None
 
+    def get(self, name: str) -> Event | None:
+        r"""
+        #### Returns the event with the given name, `None` if there is no event with that name
+        """
+        return self._events.get(name)
+
     def replace(self, name: str, new_event: Event) -> None:
-        for i, event in enumerate(self):
-            if event.name == name:
-                self[i] = new_event
+        if name in self._events:
+            self._events[name] = new_event
+            self._routes = None
 
     def remove(self, *names) -> None:
         for name in names:
-            for i, event in enumerate(self):
-                if event.name == name:
-                    del self[i]
+            if self._events.pop(name, None) is not None:
+                self._routes = None
+
+                group = _group(name)
+                if group is not None:
+                    names_of_group = self._groups[group]
+                    del names_of_group[name]
+
+                    if not names_of_group:
+                        del self._groups[group]
+
+    def remove_prefix(self, prefix: str) -> List[str]:
+        r"""
+        #### Removes every event whose name starts with `prefix`, returns the removed names
+        """
+        # a whole group (e.g. all the listeners of an object), no need to check every name
+        if _group(prefix) == prefix:
+            names = list(self._groups.get(prefix, ()))
+        else:
+            names = [name for name in self._events if name.startswith(prefix)]
+
+        self.remove(*names)
+        return names
 
     def add(self, event: Event):
-        # if event already exists, replace it
-        if self.get_by_name(event.name):
-            self.replace(event.name, event)
+        # if event already exists, it's replaced (keeps its place)
+        if event.name not in self._events:
+            group = _group(event.name)
+            if group is not None:
+                self._groups.setdefault(group, {})[event.name] = None
 
-        # otherwise, add it
-        else:
-            self.append(event)
+        self._events[event.name] = event
+        self._routes = None
 
 
 class EventHandler:
     '''
     - Manages events on the program 
+    - Objects with event listeners are kept in a spatial grid (`hit_grid`), the mouse position is checked once per event
+    - `topmost_only` : if True, only the object on top (highest `z_index`) is hovered when objects overlap
+    - `coalesce` : if True, all the mouse motion events of a frame are delivered as a single one (last `pos`, accumulated `rel`)
+      and so are mouse wheel events (accumulated `x`, `y`). Listeners added with `raw=True` still get every event
+    - `filter_events` : if True, only event types with listeners (and `QUIT`) are allowed in the pygame queue, other types are
+      dropped by SDL (all types are allowed while there are custom events or input is being recorded)
+    - `frame_event_count` : number of events processed in the last frame (`total_event_count` since the start)
+    - Hover state is tracked per object (`hovered`): `hover` listeners are called when the mouse enters an object and `unhover`
+      listeners when it leaves, the state is only updated when the mouse moves or objects with hover listeners move/resize
+    - Event listeners of objects under the mouse are called from the top object to the bottom one (`styles.z_index`, the last
+      added first for equal z-index), then base listeners. A listener can call `stop_propagation()` so no other listener
+      gets the event (e.g. a modal window on top of buttons)
     '''
     
     events = EventList()
     to_remove: List[str] = []
+    to_remove_prefix: List[str] = []
     to_add: List[Event] = []
     pressed_keys: pg.key.ScancodeWrapper = None
+    previous_keys: pg.key.ScancodeWrapper = None # key states of the previous frame
+    pressed_buttons: Tuple[bool, ...] = (False,) * 5 # mouse button states of the frame
+
+    # input recording / replay (see `InputRecorder` and `Replay`)
+    recorder = None
+    replay = None
+
+    hit_grid = SpatialGrid()
+    hovered: List[Object] = [] # objects with listeners under the mouse
+    _pointer: Tuple[int, int] | None = None # mouse position `hovered` was taken from
+    topmost_only: bool = False
+    coalesce: bool = False
+
+    consumed: bool = False # the event being dispatched was consumed (see `stop_propagation`)
+
+    filter_events: bool = True
+    _filter_state = None # (dispatch table, filter_events, recorder) the allowed types were taken from
+
+    frame_event_count: int = 0
+    total_event_count: int = 0
+    _grid_routes = None # dispatch table the grid objects were taken from
+    _hover_objects: List[Object] = [] # objects with hover listeners (their movement is checked every frame)
+    _grid_stale: bool = False # objects may have moved since the grid was last refreshed (see `_query`)
 
     __ezsgame_events = ("update",)
+    _ids = count() # makes default event names unique
 
     def check():
+        replay = EventHandler.replay
+
+        EventHandler.previous_keys = EventHandler.pressed_keys
+
         # gets widnow events
-        events = pg.event.get()
+        if replay is None:
+            events = pg.event.get()
+
+            # log pressed keys
+            EventHandler.pressed_keys = pg.key.get_pressed()
+            EventHandler.pressed_buttons = pg.mouse.get_pressed(5)
+
+        else:
+            pg.event.pump()
+            events = replay.events
+            EventHandler.pressed_keys = replay.keys
+            EventHandler.pressed_buttons = replay.buttons
 
-        # log pressed keys
-        EventHandler.pressed_keys = pg.key.get_pressed()
+        # input actions (snapshot of this frame against the previous one)
+        if Actions.actions:
+            Actions.update(EventHandler.pressed_keys, EventHandler.pressed_buttons)
+
+        EventHandler.frame_event_count = len(events)
+        EventHandler.total_event_count += len(events)
+
+        if EventHandler.recorder is not None:
+            EventHandler.recorder.add_events(events)
 
         # removes events
         for name in EventHandler.to_remove:
 
-            for event in EventHandler.events:
-                if event.name == name:
-                    EventHandler.events.remove(event)
-                    break
+            if name in EventHandler.events:
+                EventHandler.events.remove(name)
 
             # if is ezsgame event
             else:
                 # removes event from on_update signal listeners so they won't be called anymore
-                if name in World.on_update.listeners.values():
+                if name in World.on_update.listeners:
                     World.on_update.remove(name)
 
         EventHandler.to_remove.clear()
 
+        for prefix in EventHandler.to_remove_prefix:
+            EventHandler.events.remove_prefix(prefix)
+
+            for name in [name for name in World.on_update.listeners if name.startswith(prefix)]:
+                World.on_update.remove(name)
+
+        EventHandler.to_remove_prefix.clear()
+
         # adds events
         for event in EventHandler.to_add:
 
@@ -126,139 +472,313 @@ class EventHandler:
         EventHandler.to_add.clear()
 
         # EVENT MANAGEMENT -------------------------------------------------------------------------------------------
-        for ev in events:
+        # listeners by event type, rebuilt only when listeners are added or removed
+        routes = EventHandler.events.get_routes()
+        customs = routes.get("custom")
+
+        grid = EventHandler.hit_grid
+
+        # event types allowed in the queue
+        filter_state = (routes, EventHandler.filter_events, EventHandler.recorder)
+        if EventHandler._filter_state is None or any(a is not b for a, b in zip(filter_state, EventHandler._filter_state)):
+            EventHandler._sync_allowed(routes)
+            EventHandler._filter_state = filter_state
+
+        # hover state has to be updated if objects are added, removed or moved (even if the mouse didn't move)
+        hover_changed = routes is not EventHandler._grid_routes
+
+        # objects with listeners
+        if hover_changed:
+            grid.sync(EventHandler.events.objects)
+            EventHandler._grid_routes = routes
+            EventHandler._hover_objects = list({**routes.get("enter", {}), **routes.get("leave", {})})
+
+        # objects may have moved since last frame, every object is only checked when a hit test is needed (idle frames are free)
+        EventHandler._grid_stale = True
+
+        # objects with hover listeners are checked every frame, hover changes if they move under a still mouse
+        if EventHandler._hover_objects and grid.refresh(EventHandler._hover_objects):
+            hover_changed = True
+
+        has_hover = "enter" in routes or "leave" in routes
+
+        # (event, route, is raw copy)
+        if EventHandler.coalesce:
+            queue = EventHandler._coalesce(events)
+        else:
+            queue = [(ev, ev.type, False) for ev in events]
+
+        for ev, route_type, raw in queue:
             # ev : event to process
+            hovered = None # objects under the mouse (found when first needed)
 
             # quit event (cannot be event listener)
             if ev.type == pg.QUIT:
-                for event in EventHandler.events.get_by_type(pg.QUIT):
-                    event.callback()
+                if pg.QUIT in routes:
+                    for event, _ in routes[pg.QUIT][1][1]:
+                        event.callback()
 
                 World.window.quit()
 
-            # Manages custom events
-            for event in EventHandler.events.get_by_type("custom"):
+            # Manages custom events (raw copies of coalesced events are only for raw listeners)
+            if customs is not None and not raw:
                 event_args = {
                     "key": ev.key if ev.__dict__.get("key") else None,
                     "unicode": ev.unicode if ev.__dict__.get("unicode") else None,
                     "type": ev.type,
                     "button": ev.button if ev.__dict__.get("button") else None,
-                    "is_hovering": EventHandler.is_hovering(event["object"]) if "object" in event else False
                 }
 
-                event(**event_args)
+                for event, _ in customs[1]:
+                    if event.object is not None:
+                        if hovered is None:
+                            hovered = EventHandler._get_hovered(ev)
 
-            #  EVENT LOOP (managing events)
-            for event in EventHandler.events.get_by_type(ev.type):
+                        event_args["is_hovering"] = event.object in hovered
 
-                # if is event listener (uses a object)
-                is_event_listener = event.object is not None
-                is_hovering = False
+                    else:
+                        event_args["is_hovering"] = False
 
-                if is_event_listener:
-                    is_hovering = EventHandler.is_hovering(event.object)
+                    event(**event_args)
 
-                    # if is not hovering and event is not unhover then skip
-                    if not is_hovering and not event.event_name == "unhover":
-                        continue
+            # hover transitions
+            if has_hover and ev.type == pg.MOUSEMOTION and not raw:
+                EventHandler.update_hover(ev.pos, routes)
 
-                # function to reduce code, function decides whaterver callback should called or not
-                def callback():
-                    if is_event_listener:
-                        # events that require be hovering
-                        if is_hovering and event.object.styles.visible:
-                            event.callback()
+            route = routes.get(route_type)
+            if route is None:
+                continue
 
-                    # if is not event listener is base event, just call callback
-                    else:
-                        event.callback()
+            by_code, listeners = route
 
-                # mouse events
-                if ev.type == pg.MOUSEBUTTONDOWN:
-                    # mouse wheel up
-                    if event.event_name == "mousewheelup" and ev.button == 4:
-                        callback()
-                        continue
-
-                        # mouse wheel down
-                    elif event.event_name == "mousewheeldown" and ev.button == 5:
-                        callback()
-                        continue
-                
-                    # right mouse button
-                    elif event.event_name == "rightclick" and ev.button == 3:
-                        callback()
-                        continue
-                            
-                    # click, mousedown or leftclick
-                    elif event.event_name in ("click", "mousedown", "leftclick") and ev.button == 1:
-                        callback()
-                        continue
-                    
-
-                # hover events
-                elif ev.type == pg.MOUSEMOTION:
-                    if event.event_name == "unhover":
-                        if not is_hovering:
+            # mouse buttons and keys are routed by button/key
+            if by_code:
+                code = ev.__dict__.get("button") if ev.type == pg.MOUSEBUTTONDOWN else ev.__dict__.get("key")
+                listeners = by_code.get(code, listeners)
+
+            by_object, base = listeners
+            EventHandler.consumed = False
+
+            #  EVENT LOOP (managing events)
+            # event listeners (use a object) of the objects under the mouse, from the top one to the bottom one
+            if by_object:
+                if hovered is None:
+                    hovered = EventHandler._get_hovered(ev)
+
+                targets = [obj for obj in hovered if obj in by_object]
+                if len(targets) > 1:
+                    order = EventHandler.hit_grid._order
+                    targets.sort(key=lambda obj: (obj.styles.z_index, order[obj]), reverse=True)
+
+                for obj in targets:
+                    for event, mode in by_object[obj]:
+                        if mode == _CALL:
+                            if obj.styles.visible:
+                                event.callback()
+
+                        elif mode == _PLAIN:
                             event.callback()
-                            continue
 
-                    else:
-                        callback()
-                        continue
+                        else:
+                            event(key=ev.key, unicode=ev.unicode)
 
-                # mouse up events
-                elif ev.type == pg.MOUSEBUTTONUP:
-                    if event.event_name == "mouseup" or event.type == pg.MOUSEBUTTONUP:
-                        event.callback()
+                        if EventHandler.consumed:
+                            break
 
-                    else:
-                        callback()
+                    if EventHandler.consumed:
+                        break
 
-                elif "key" in event:
-                    if event.key == ev.key:
-                        event(key=ev.key, unicode=ev.unicode)
-                        continue
+            if EventHandler.consumed:
+                continue
 
-                # base on key event keydown or keyapp
-                elif event.type in (pg.KEYDOWN, pg.KEYUP):
+            # base events, just call callback
+            for event, mode in base:
+                if mode == _KEYED:
                     event(key=ev.key, unicode=ev.unicode)
 
-                # any event that matchess current window event
                 else:
-                    callback()
+                    event.callback()
+
+                if EventHandler.consumed:
+                    break
+
+        # objects moved or listeners changed, the mouse may be over other objects now
+        if has_hover and hover_changed:
+            EventHandler.update_hover(EventHandler._pointer or EventHandler.get_mouse_pos(), routes, force=True)
+
+        elif not has_hover and EventHandler.hovered:
+            EventHandler.hovered = []
+
+    def stop_propagation() -> None:
+        '''
+        #### Called from a listener, the event being dispatched is not passed to the remaining listeners (objects below and base events)
+        '''
+        EventHandler.consumed = True
+
+    def update_hover(pos: Tuple[int, int], routes: Dict | None = None, force: bool = False) -> None:
+        '''
+        #### Updates which objects are under the mouse, calls `hover` listeners of the objects the mouse entered and
+        `unhover` listeners of the ones it left
+        - `pos` : mouse position
+        - `routes` : dispatch table (Optional)
+        - `force` : if False, nothing is done if the mouse position didn't change (Optional)
+        '''
+        if not force and pos == EventHandler._pointer:
+            return
+
+        EventHandler._pointer = pos
+        routes = routes or EventHandler.events.get_routes()
+
+        hovered = EventHandler._query(*pos)
+        if len(hovered) > 1:
+            hovered.sort(key=EventHandler.hit_grid._order.__getitem__)
+
+        previous = EventHandler.hovered
+        EventHandler.hovered = hovered
+
+        if previous == hovered:
+            return
+
+        leave = routes.get("leave")
+        if leave:
+            for obj in previous:
+                if obj not in hovered and obj in leave:
+                    for event in leave[obj]:
+                        event.callback()
+
+        enter = routes.get("enter")
+        if enter:
+            for obj in hovered:
+                if obj not in previous and obj in enter and obj.styles.visible:
+                    for event in enter[obj]:
+                        event.callback()
 
-    def add_event(event: str, object: Object, callback, name: str = "Default"):
+    def add_event(event: str, object: Object, callback, name: str = "Default", raw: bool = False):
         '''
         #### Adds a event listener to a object
         - `event` : event to be added 
                 - Events : `click`, `hover`, `unhover`, `unclick`.
+                - `hover` / `unhover` (also `mouseenter` / `mouseleave`) are called when the mouse enters / leaves the object
         - `name` : name of the event 
         - `object` : object to be added to the event 
         - `callback` : function to be called when the event is triggered
+        - `raw` : if True, the listener gets every mouse motion/wheel event even if `EventHandler.coalesce` is True (Optional)
+
+        Default names are `"{id(object)}.{event}.{n}"`, so `remove_event(f"{id(object)}.", prefix=True)` removes all the
+        listeners of the object at once (only its own listeners are visited, see `EventList`)
         '''
         
         event, event_type = EventHandler._convert_to_pgevent(event)
         
         if name == "Default":
-            name = f"{event}.{id(object)}.{len(EventHandler.events)}.{len(EventHandler.to_add)}"
+            name = f"{id(object)}.{event}.{next(EventHandler._ids)}"
             
         EventHandler.to_add.append(
-            Event(event_type, event, callback, object, name))
+            Event(event_type, event, callback, object, name, raw=raw))
 
-    def remove_event(name: str):
+    def remove_event(name: str, prefix: bool = False):
         f'''
         #### Removes an event from the event list so it won't be called anymore
         -  `name` : name of the event to be removed 
+        -  `prefix` : if True, every event whose name starts with `name` is removed (Optional)
+        '''
+        if prefix:
+            EventHandler.to_remove_prefix.append(name)
+        else:
+            EventHandler.to_remove.append(name)
+
+    def _sync_allowed(routes: Dict) -> None:
+        # custom events get every event and recordings need every event to be replayed
+        if not EventHandler.filter_events or "custom" in routes or EventHandler.recorder is not None:
+            pg.event.set_allowed(None)
+            return
+
+        allowed = {event_type for event_type in routes if isinstance(event_type, int)}
+        allowed.add(pg.QUIT)
+
+        pg.event.set_blocked(None)
+        pg.event.set_allowed(list(allowed))
+
+    def _coalesce(events: List[pg.event.Event]) -> List[Tuple[pg.event.Event, int | Tuple, bool]]:
+        # every motion/wheel event is kept for raw listeners, the coalesced one is placed where the last one was
+        last = {}
+        for index, ev in enumerate(events):
+            if ev.type in _COALESCED_TYPES:
+                last[ev.type] = index
+
+        if not last:
+            return [(ev, ev.type, False) for ev in events]
+
+        queue = []
+        rel_x = rel_y = wheel_x = wheel_y = precise_x = precise_y = 0
+
+        for index, ev in enumerate(events):
+            event_type = ev.type
+
+            if event_type not in _COALESCED_TYPES:
+                queue.append((ev, event_type, False))
+                continue
+
+            queue.append((ev, ("raw", event_type), True))
+
+            if event_type == pg.MOUSEMOTION:
+                rel_x += ev.rel[0]
+                rel_y += ev.rel[1]
+
+            else:
+                wheel_x += ev.x
+                wheel_y += ev.y
+                precise_x += ev.__dict__.get("precise_x", ev.x)
+                precise_y += ev.__dict__.get("precise_y", ev.y)
+
+            if index != last[event_type]:
+                continue
+
+            # last one, carries the accumulated values
+            if event_type == pg.MOUSEMOTION:
+                coalesced = pg.event.Event(event_type, dict(ev.__dict__, rel=(rel_x, rel_y)))
+            else:
+                coalesced = pg.event.Event(
+                    event_type, dict(ev.__dict__, x=wheel_x, y=wheel_y, precise_x=precise_x, precise_y=precise_y)
+                )
+
+            queue.append((coalesced, ("coalesced", event_type), False))
+
+        return queue
+
+    def _get_hovered(ev: pg.event.Event) -> List[Object]:
+        # objects with listeners under the mouse when the event happened
+        x, y = ev.__dict__.get("pos") or EventHandler.get_mouse_pos()
+        return EventHandler._query(x, y)
+
+    def _query(x: float, y: float) -> List[Object]:
+        # boxes are refreshed once per frame, on the first hit test
+        if EventHandler._grid_stale:
+            EventHandler._grid_stale = False
+            EventHandler.hit_grid.refresh()
+
+        hovered = EventHandler.hit_grid.query(x, y)
+
+        if EventHandler.topmost_only and len(hovered) > 1:
+            hovered = [EventHandler.hit_grid.topmost(hovered)]
+
+        return hovered
+
+    def get_mouse_pos():
+        r'''
+        #### Returns the mouse position (the recorded one while replaying)
         '''
-        EventHandler.to_remove.append(name)
+        if EventHandler.replay is not None:
+            return EventHandler.replay.mouse_pos
+
+        return pg.mouse.get_pos()
 
     def is_hovering(object: Object) -> bool:
         '''
         #### Checks if the mouse is hovering over the object
         - `object` : object to check if the mouse is hovering over it
         '''
-        mouse_pos = pg.mouse.get_pos()
+        mouse_pos = EventHandler.get_mouse_pos()
         box = object._get_collision_box()
 
         if mouse_pos[0] > box[0][0] and mouse_pos[0] < box[1][0]:
@@ -267,16 +787,17 @@ class EventHandler:
 
         return False
 
-    def on_event(event: str, callback, name: str = "Default"):
+    def on_event(event: str, callback, name: str = "Default", raw: bool = False):
         '''
         #### Adds a `Base Event` to the event list, Calls function when event is triggered. 
         - `event`: event to be added 
                 - Events : `quit`, `mousemotion`, `mousedown`, `mouseup`, `keydown`, `keyup`, `mousewheel`, `update`
         -  `callback`: function to be called when the event is triggered ``function``
         - `name`: name of event (optional)
+        - `raw` : if True, the listener gets every mouse motion/wheel event even if `EventHandler.coalesce` is True (Optional)
         '''
         
-        name = f"base_event.{event}.{len(EventHandler.events)}" if name == "Default" else name
+        name = f"base_event.{event}.{next(EventHandler._ids)}" if name == "Default" else name
 
         # if is ezsgame event
         if event in EventHandler.__ezsgame_events:
@@ -287,7 +808,7 @@ class EventHandler:
         event, event_type = EventHandler._convert_to_pgevent(event)
 
         EventHandler.to_add.append(
-            Event(event_type, event, callback, None, name))
+            Event(event_type, event, callback, None, name, raw=raw))
 
     def on_key(type: str, keys: list, callback, name: str = "Default"):
         '''
@@ -308,13 +829,13 @@ class EventHandler:
         if not event_type:
             raise ValueError("Invalid type: \nValid types are: \"up\", \"down\"", type)
 
-        for key in keys:
-            k = to_pgkey(key)
+        # one listener for all the keys, so it can be removed by its name
+        codes = tuple(to_pgkey(key) for key in keys)
 
-            name = f"{key}_{type}_{len(EventHandler.events)}" if name == "Default" else name
+        name = f"{'_'.join(map(str, keys))}_{type}_{next(EventHandler._ids)}" if name == "Default" else name
 
-            EventHandler.to_add.append(
-                Event(event_type, k, callback, None, name, key=k))
+        EventHandler.to_add.append(
+            Event(event_type, codes, callback, None, name, keys=codes))
 
     def custom_event(callback, object=None, name: str = "Default"):
         '''
@@ -324,7 +845,7 @@ class EventHandler:
         - `name`: name of event (optional)
         '''
 
-        name = f"custom_event.{name}.{len(EventHandler.events)}" if name == "Default" else name
+        name = f"custom_event.{name}.{next(EventHandler._ids)}" if name == "Default" else name
 
         EventHandler.to_add.append(
             Event("custom", "custom", callback, object, name))
@@ -343,10 +864,13 @@ class EventHandler:
             "mousedown": pg.MOUSEBUTTONDOWN,
             "mouseup": pg.MOUSEBUTTONUP,
             "unhover": pg.MOUSEMOTION,
+            "mouseenter": pg.MOUSEMOTION,
+            "mouseleave": pg.MOUSEMOTION,
             "unclick": pg.MOUSEBUTTONUP,
             "keydown": pg.KEYDOWN,
             "keyup": pg.KEYUP,
             "mousewheelmotion": pg.MOUSEWHEEL,
+            "mousewheel": pg.MOUSEWHEEL,
             "mousemotion": pg.MOUSEMOTION,
             "quit": pg.QUIT,
             "mousebuttondown": pg.MOUSEBUTTONDOWN,
@@ -380,33 +904,35 @@ def on_key(type: str, keys: Iterable | str, name: str = "Default") -> Callable:
 
     return wrapper
 
-def add_event(event: str, object: Object, name: str = "Default") -> Callable:
+def add_event(event: str, object: Object, name: str = "Default", raw: bool = False) -> Callable:
     '''
     #### Adds an event listener to an object
     - `event` : event to listen to
     - `object` : object that will be "listening"
     - `name` : name of the event (Optional)
+    - `raw` : if True, gets every mouse motion/wheel event even if events are coalesced (Optional)
     '''
 
     def wrapper(func):
-        EventHandler.add_event(event, object, func, name)
+        EventHandler.add_event(event, object, func, name, raw)
         return func
 
     return wrapper
 
-def on_event(event: str, name: str = "Default") -> Callable:
+def on_event(event: str, name: str = "Default", raw: bool = False) -> Callable:
     '''
     #### Calls funcion when the event is triggered, (Base Event)
     - `event` : event to listen to
             - Events : `quit`, `mousemotion`, `mousedown`, `mouseup`, `keydown`, `keyup`, `mousewheel`
     - `name` : name of the event (Optional)
+    - `raw` : if True, gets every mouse motion/wheel event even if events are coalesced (Optional)
     '''
 
     if name == "Default":
-        name = f"base_event.{event}.{len(EventHandler.events)}.{random.uniform(1, 10)}" if name == "Default" else name
+        name = f"base_event.{event}.{next(EventHandler._ids)}" if name == "Default" else name
 
     def wrapper(func):
-        EventHandler.on_event(event, func, name)
+        EventHandler.on_event(event, func, name, raw)
         return func
 
     return wrapper
@@ -423,12 +949,20 @@ def custom_event(object=None, name: str = "Default") -> Callable:
 
     return wrapper
 
-def remove_event(name: str):
+def remove_event(name: str, prefix: bool = False):
     '''
     #### Removes an event from the event handler
     - `name` : name of the event
+    - `prefix` : if True, every event whose name starts with `name` is removed, e.g. all the listeners of an object
+      added with default names: `remove_event(f"{id(object)}.", prefix=True)` (Optional)
     '''
-    EventHandler.remove_event(name)
+    EventHandler.remove_event(name, prefix)
+
+def stop_propagation() -> None:
+    '''
+    #### Called from an event listener, the event is not passed to any other listener (objects below, base events)
+    '''
+    EventHandler.consumed = True
 
 
 def is_down(key: str) -> bool:
@@ -436,10 +970,22 @@ def is_down(key: str) -> bool:
     #### Returns if the key being is pressed
     - `key` : key to check
     '''
-    return pg.key.get_pressed()[to_pgkey(key)]
+    # key states are taken once per frame by `EventHandler.check` (they only change when events are processed)
+    pressed = EventHandler.pressed_keys or pg.key.get_pressed()
+    return pressed[to_pgkey(key)]
 
 def went_down(key: str) -> bool:
     '''
-    #### Returns `True` if the key was pressed during this frame
+    #### Returns `True` if the key was pressed during this frame (it was up the previous frame)
+    '''
+    code = to_pgkey(key)
+    previous = EventHandler.previous_keys
+    return EventHandler.pressed_keys[code] and not (previous is not None and previous[code])
+
+def went_up(key: str) -> bool:
+    '''
+    #### Returns `True` if the key was released during this frame (it was down the previous frame)
     '''
-    return EventHandler.pressed_keys[to_pgkey(key)]
\ No newline at end of file
+    code = to_pgkey(key)
+    previous = EventHandler.previous_keys
+    return previous is not None and previous[code] and not EventHandler.pressed_keys[code]
\ No newline at end of file
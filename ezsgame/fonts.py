@@ -7,14 +7,21 @@ class FontFamily:
         
         """
         if is_variation is True then main_font is the file name of the font, not just the name of the font
+        Note: font families look for their variations the first time they are used
         """
+        self._folder_name = folder_name
+        self._main_font = main_font
+        self._loaded = is_variation
+
         # is variation font
         if is_variation:
             self.font_file = f"{FONTS_PATH}/{folder_name}/{main_font}"
-        
-        
+
+    def _load(self):
         # if font family  get main font and variations
-        else:
+        if not self._loaded:
+            self._loaded = True
+            folder_name, main_font = self._folder_name, self._main_font
 
             # get variations                
             for filename in os.listdir(FONTS_PATH + "/" + folder_name):
@@ -32,7 +39,18 @@ class FontFamily:
                     # set variations
                     setattr(self, font_name.lower(), FontFamily(folder_name, filename, True))
             
+    def __getattr__(self, name):
+        # variations and font file are not set until the family is loaded
+        if name.startswith("_") or self._loaded:
+            raise AttributeError(f"{self.__class__.__name__} has no attribute {name!r}")
+
+        self._load()
+        return getattr(self, name)
+
     def get_font(self, font_size) -> pg.font.Font:
+        if not pg.font.get_init():
+            pg.font.init()
+
         return pg.font.Font(self.font_file, font_size)
     
 
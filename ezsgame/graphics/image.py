@@ -56,6 +56,16 @@ class Image(Object):
         if scale:
             self.image = pg.transform.scale(self.image, self.size)
 
+    def _get_draw_state(self) -> tuple:
+        return (self.image, self.styles.visible)
+
+    def _get_blit(self):
+        # objects with on draw listeners (components) have to go through the draw wrapper
+        if not self.styles.visible or self.on_draw.listeners:
+            return None
+
+        return (self.image, self.pos)
+
     def draw(self):
         self.window.surface.blit(self.image, self.pos)
 
@@ -6,7 +6,7 @@ from ..styles.styles_resolver import resolve_position, resolve_size
 from ..styles.units import Measure
 from ezsgame.types import Pos, Size
 from ..world import get_window
-from PIL import Image, ImageSequence
+from ..time_handler import TimeHandler
 
 
 pgSpriteClass = pygame.sprite.Sprite
@@ -54,6 +54,8 @@ class Sprite(pgSpriteClass):
         self.rect.size = size
         self.start_pos = pos
         self.start_size = size
+        self.static = static
+        self._draw_state = None
 
         if static:
             self.draw = lambda: self.window.surface.blit(self.image, self.rect)
@@ -64,10 +66,25 @@ class Sprite(pgSpriteClass):
         self.rect.topleft = self.pos
         self.rect.size = self.size
 
+    def _get_bounds(self) -> tuple:
+        return tuple(self.rect)
+
+    def _get_draw_state(self) -> tuple:
+        return (self.image,)
+
+    def _get_blit(self):
+        if not self.static:
+            self._update()
+
+        return (self.image, self.rect)
+
     def draw(self):
         self._update()
         self.window.surface.blit(self.image, self.rect)
 
+        if self.window.dirty_regions is not None:
+            self.window.dirty_regions.track(self, self._get_bounds(), self._get_draw_state())
+
 
 class AnimatedSprite(pgSpriteClass):
     _cached_frames: Dict[str, List[pygame.Surface]] = {} # {path: [frames]} used to cache frames/resources for animated sprites
@@ -105,12 +122,16 @@ class AnimatedSprite(pgSpriteClass):
 
         self.current_frame = 0
         self.last_update_time = 0
+        self._draw_state = None
 
         if sprite in self._cached_frames:
             self.frames = self._cached_frames[sprite]
 
         # load frames (sprite is a gif)
         else:
+            # PIL is only needed for animated sprites
+            from PIL import Image, ImageSequence
+
             self.frames = [
                 pygame.image.fromstring(frame.tobytes(), frame.size, frame.mode)
                 for frame in ImageSequence.Iterator(Image.open(sprite))
@@ -137,7 +158,7 @@ class AnimatedSprite(pgSpriteClass):
         self._cached_sprites[sprite] = (size, frame_rate, scale, self.draw)
 
     def _update(self):
-        current_time = pygame.time.get_ticks()
+        current_time = TimeHandler.get_ticks()
 
         # calculate time since last update
         time_since_last_update = current_time - self.last_update_time
@@ -148,10 +169,23 @@ class AnimatedSprite(pgSpriteClass):
             self.image = self.frames[self.current_frame]
             self.last_update_time = current_time
 
+    def _get_bounds(self) -> tuple:
+        return tuple(self.rect)
+
+    def _get_draw_state(self) -> tuple:
+        return (self.current_frame,)
+
+    def _get_blit(self):
+        self._update()
+        return (self.image, self.rect)
+
     def draw(self):
         self._update()
         self.window.surface.blit(self.image, self.rect)
 
+        if self.window.dirty_regions is not None:
+            self.window.dirty_regions.track(self, self._get_bounds(), self._get_draw_state())
+
 class AnimatedSpriteRef:
 
     def __new__(
@@ -80,6 +80,14 @@ class Circle(Object):
             self.styles.stroke,
         )
 
+    def _get_bounds(self) -> tuple:
+        # circles are positioned by their center
+        x, y = self.pos
+        return (x - self.radius, y - self.radius, self.radius * 2, self.radius * 2)
+
+    def _get_draw_state(self) -> tuple:
+        return (*super()._get_draw_state(), self.radius)
+
     def _get_collision_box(self):
         center_x, center_y = self.pos
         radius = self.size[0] / 2
@@ -138,6 +146,13 @@ class Line:
     def draw(self):
         pg.draw.line(self.window.surface, self.color, self.start, self.end, self.width)
 
+    def _get_bounds(self) -> tuple:
+        # box containing both ends of the line plus its width
+        half = self.width / 2
+        left, right = sorted((self.start[0], self.end[0]))
+        top, bottom = sorted((self.start[1], self.end[1]))
+        return (left - half, top - half, right - left + self.width, bottom - top + self.width)
+
     def _get_collision_box(self):
         # collision is checked at line end
         return (
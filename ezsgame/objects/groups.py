@@ -2,7 +2,9 @@ from typing import Any, Tuple, Union
 from ..funcs import center_at
 
 from ..objects.object import Object
+from ..rendering import draw_batched
 from ..types import Pos
+from ..world import get_window
 
 
 class Group:
@@ -120,8 +122,7 @@ class Group:
         if self._parent:
             self.align_objects()
 
-        for obj in sorted(self.values(), key=lambda x: x.styles.z_index):
-            obj.draw()
+        draw_batched(sorted(self.values(), key=lambda x: x.styles.z_index), get_window().surface)
 
     def map(self, func):
         for obj in self.values():
@@ -27,8 +27,12 @@ class Object:
         "parent",
         "children",
         "styles",
+        "_draw_state",
     )
 
+    # objects that are drawn by blitting a single surface return `(surface, pos)` from this method, used to batch blits
+    _get_blit = None
+
     def __init__(
         self,
         pos: Pos | Iterable[Measure],
@@ -43,6 +47,7 @@ class Object:
         """
         self.window = get_window()
         self.children: Set[Object] = set()
+        self._draw_state = None
 
         if parent:
             self.parent = parent
@@ -74,6 +79,12 @@ class Object:
                 if self.styles.visible:
                     draw_func()
 
+                # report changes to the window (dirty rects mode)
+                if self.window.dirty_regions is not None:
+                    self.window.dirty_regions.track(
+                        self, self._get_bounds(), self._get_draw_state()
+                    )
+
                 self.on_draw.trigger()
 
             return wrapper
@@ -84,7 +95,7 @@ class Object:
             pass
 
         # Register object in DATA
-        World.objects_to_add.add(self)
+        World.objects_to_add.append(self)
 
     def _update(self, updated_property_name: str) -> None:
         """
@@ -102,6 +113,29 @@ class Object:
         """
         pass
 
+    def _get_bounds(self) -> tuple:
+        """
+        Returns the region of the screen the object draws in `(x, y, width, height)`
+        """
+        x, y = self.pos
+        w, h = self.size
+        return (x, y, w, h)
+
+    def _get_draw_state(self) -> tuple:
+        """
+        Returns the values that change the way the object looks, used to detect when the object has to be redrawn.
+        """
+        styles = self.styles
+        return (styles.color, styles.stroke, styles.visible)
+
+    def mark_dirty(self) -> None:
+        r"""
+        #### Marks the region of the object as dirty so it will be presented in the next frame (dirty rects mode)
+        Only needed if the object changes in a way it can't report by itself.
+        """
+        if self.window.dirty_regions is not None:
+            self.window.dirty_regions.add(self._get_bounds())
+
     def _get_collision_box(self):
         x, y = self.pos
         w, h = self.size
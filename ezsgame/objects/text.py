@@ -11,9 +11,6 @@ from ..types import Pos, Size, Signal
 from ..fonts import Fonts, FontFamily
 
 
-pg.font.init()
-
-
 class Text(Object):
     r"""
     #### Text
@@ -87,6 +84,9 @@ class Text(Object):
         )
 
     def load_font(self):
+        if not pg.font.get_init():
+            pg.font.init()
+
         # is font is a ezsgame font
         if isinstance(self.font, FontFamily):
             font = self.font.get_font(self.font_size.get())
@@ -121,5 +121,25 @@ class Text(Object):
 
         super()._update(updated_property_name)
 
+    def _get_bounds(self) -> tuple:
+        # size of the rendered text (size can include margins)
+        x, y = self.pos
+        return (x, y, *self.text_obj.get_size())
+
+    def _get_draw_state(self) -> tuple:
+        return (self.text_obj, self.styles.visible)
+
+    def _get_blit(self):
+        if self.on_draw.listeners:
+            return None
+
+        return (self.text_obj, self.pos)
+
     def draw(self):
         self.window.surface.blit(self.text_obj, self.pos)
+
+        # text draw method is not wrapped (slots), so it reports changes by itself
+        if self.window.dirty_regions is not None:
+            self.window.dirty_regions.track(
+                self, self._get_bounds(), self._get_draw_state()
+            )
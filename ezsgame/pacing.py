@@ -0,0 +1,201 @@
+"""
+Module for frame pacing (waiting between frames, dropping renders and adapting the target fps under load)
+"""
+
+from time import perf_counter, sleep
+from typing import Dict
+import pygame as pg
+
+
+class FramePacer:
+    r"""
+    #### Frame Pacer
+    Replaces the plain `clock.tick(fps)` of the window with a pacing policy.
+
+    #### Parameters
+    - `precise` : if True, sleeps until `spin_time` seconds before the end of the frame and then spin-waits (more accurate, uses more CPU)
+    - `spin_time` : time in seconds to spin-wait at the end of the frame (precise mode)
+    - `max_render_skip` : max number of consecutive frames that can skip drawing when frames take longer than the budget,
+    so the logic keeps real time under load (`0` never skips)
+    - `adaptive` : if True, the target fps is lowered by `fps_step` when the budget is missed `miss_limit` frames in a row,
+    and raised back when `recover_limit` frames in a row have enough headroom
+    - `min_fps` : lowest target fps (adaptive mode)
+    - `fps_step` : how much the target fps changes every time (adaptive mode)
+    - `miss_limit` : consecutive missed frames before lowering the target fps (adaptive mode)
+    - `recover_limit` : consecutive frames using less than 75% of the budget of the higher fps before raising the target fps (adaptive mode)
+
+    #### Counters
+    Every decision is counted in `counters`:
+    `frames`, `missed` (frames over budget), `sleeps`, `spins`, `skipped_renders`, `fps_decreases`, `fps_increases`
+    """
+
+    __slots__ = (
+        "precise",
+        "spin_time",
+        "max_render_skip",
+        "adaptive",
+        "min_fps",
+        "fps_step",
+        "miss_limit",
+        "recover_limit",
+        "max_fps",
+        "target_fps",
+        "render",
+        "counters",
+        "_deadline",
+        "_frame_start",
+        "_skipped",
+        "_misses",
+        "_headroom",
+    )
+
+    def __init__(
+        self,
+        precise: bool = True,
+        spin_time: float = 0.002,
+        max_render_skip: int = 0,
+        adaptive: bool = False,
+        min_fps: int = 30,
+        fps_step: int = 10,
+        miss_limit: int = 10,
+        recover_limit: int = 120,
+    ):
+        self.precise = precise
+        self.spin_time = spin_time
+        self.max_render_skip = max_render_skip
+        self.adaptive = adaptive
+        self.min_fps = min_fps
+        self.fps_step = fps_step
+        self.miss_limit = miss_limit
+        self.recover_limit = recover_limit
+
+        # set by the window
+        self.max_fps: int = 0
+        self.target_fps: int = 0
+
+        # if False the current frame shouldn't be drawn (see `max_render_skip`)
+        self.render: bool = True
+
+        self.counters: Dict[str, int] = dict.fromkeys(
+            (
+                "frames",
+                "missed",
+                "sleeps",
+                "spins",
+                "skipped_renders",
+                "fps_decreases",
+                "fps_increases",
+            ),
+            0,
+        )
+
+        self._deadline: float = 0.0
+        self._frame_start: float = perf_counter()
+        self._skipped: int = 0
+        self._misses: int = 0
+        self._headroom: int = 0
+
+    def set_fps(self, fps: int) -> None:
+        r"""
+        #### Sets the max fps (called by the window), the target fps is reset to it
+        """
+        self.max_fps = fps
+        self.target_fps = fps
+        self._deadline = 0.0
+        self._frame_start = perf_counter()
+
+    def tick(self, clock: pg.time.Clock) -> None:
+        r"""
+        #### Waits until the end of the current frame, called by `Window.update`
+        """
+        counters = self.counters
+        counters["frames"] += 1
+
+        now = perf_counter()
+        work_time = now - self._frame_start
+
+        # first frame
+        if not self._deadline:
+            self._deadline = self._frame_start
+
+        # uncapped
+        if self.target_fps <= 0:
+            clock.tick()
+            self._frame_start = perf_counter()
+            return
+
+        budget = 1 / self.target_fps
+        deadline = self._deadline + budget
+
+        missed = work_time > budget or now > deadline
+        if missed:
+            counters["missed"] += 1
+
+            # don't try to catch up with the lost time, start counting from now
+            deadline = now
+
+        else:
+            self._wait(deadline)
+
+        self._deadline = deadline
+        clock.tick()
+
+        if self.adaptive:
+            self._adapt(missed, work_time)
+
+        # render skipping
+        if missed and self._skipped < self.max_render_skip:
+            self._skipped += 1
+            self.render = False
+            counters["skipped_renders"] += 1
+        else:
+            self._skipped = 0
+            self.render = True
+
+        self._frame_start = perf_counter()
+
+    def _wait(self, deadline: float) -> None:
+        remaining = deadline - perf_counter()
+
+        if not self.precise:
+            if remaining > 0:
+                sleep(remaining)
+                self.counters["sleeps"] += 1
+            return
+
+        if remaining > self.spin_time:
+            sleep(remaining - self.spin_time)
+            self.counters["sleeps"] += 1
+
+        if perf_counter() < deadline:
+            self.counters["spins"] += 1
+            while perf_counter() < deadline:
+                pass
+
+    def _adapt(self, missed: bool, work_time: float) -> None:
+        if missed:
+            self._misses += 1
+            self._headroom = 0
+
+            if self._misses >= self.miss_limit and self.target_fps > self.min_fps:
+                self.target_fps = max(self.min_fps, self.target_fps - self.fps_step)
+                self.counters["fps_decreases"] += 1
+                self._misses = 0
+            return
+
+        self._misses = 0
+
+        if self.target_fps >= self.max_fps:
+            return
+
+        # would the frame fit in the budget of the next step up
+        higher_fps = min(self.max_fps, self.target_fps + self.fps_step)
+        if work_time < 0.75 / higher_fps:
+            self._headroom += 1
+        else:
+            self._headroom = 0
+
+        if self._headroom >= self.recover_limit:
+            self.target_fps = higher_fps
+            self.counters["fps_increases"] += 1
+            self._headroom = 0
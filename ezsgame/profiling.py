@@ -0,0 +1,265 @@
+"""
+Module for measuring the performance of the main loop
+"""
+
+from array import array
+from collections import Counter
+from threading import Event, Lock, Thread, get_ident
+from typing import Dict, List, Tuple
+import os, sys
+
+
+class FrameTimings:
+    r"""
+    #### Frame Timings
+    Keeps the time (in seconds) spent in each phase of the last `size` frames in a ring buffer.
+
+    #### Phases
+    - `time` : `TimeHandler.check`
+    - `events` : `EventHandler.check`
+    - `update` : the update function passed to `window.run`
+    - `draw` : drawing function and objects auto draw
+    - `on_update` : `World.on_update` listeners
+    - `present` : presenting the frame and waiting for the clock tick
+
+    #### Example
+    ```python
+    window = Window(frame_timings=True)
+    ...
+    window.timings.percentile("draw", 95) # 95th percentile of the draw phase
+    print(window.timings.report())
+    ```
+    """
+
+    PHASES = ("time", "events", "update", "draw", "on_update", "present")
+
+    __slots__ = ("size", "frames", "_buffers", "_current")
+
+    def __init__(self, size: int = 300):
+        self.size: int = size
+        self.frames: int = 0 # number of recorded frames
+
+        self._buffers: Dict[str, array] = {
+            phase: array("d", bytes(8 * size)) for phase in self.PHASES
+        }
+        self._current: Dict[str, float] = dict.fromkeys(self.PHASES, 0.0)
+
+    def add(self, phase: str, seconds: float) -> None:
+        r"""
+        #### Adds time to a phase of the current frame
+        """
+        self._current[phase] += seconds
+
+    def next_frame(self) -> None:
+        r"""
+        #### Stores the current frame into the buffer and starts a new one, called by `Window.update`
+        """
+        index = self.frames % self.size
+        current = self._current
+
+        for phase, buffer in self._buffers.items():
+            buffer[index] = current[phase]
+            current[phase] = 0.0
+
+        self.frames += 1
+
+    def get(self, phase: str) -> List[float]:
+        r"""
+        #### Returns the recorded times of a phase, from oldest to newest
+        """
+        buffer = self._buffers[phase]
+
+        if self.frames < self.size:
+            return buffer[: self.frames].tolist()
+
+        index = self.frames % self.size
+        return (buffer[index:] + buffer[:index]).tolist()
+
+    def percentile(self, phase: str, percent: float) -> float:
+        r"""
+        #### Returns the given percentile (`0` - `100`) of a phase, in seconds
+        """
+        values = sorted(self._buffers[phase][: min(self.frames, self.size)])
+        if not values:
+            return 0.0
+
+        index = round(percent / 100 * (len(values) - 1))
+        return values[index]
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        r"""
+        #### Returns the p50, p95 and p99 of every phase, in seconds
+        `{"draw" : {"p50" : 0.001, "p95" : 0.002, "p99" : 0.004}, ...}`
+        """
+        return {
+            phase: {
+                "p50": self.percentile(phase, 50),
+                "p95": self.percentile(phase, 95),
+                "p99": self.percentile(phase, 99),
+            }
+            for phase in self.PHASES
+        }
+
+    def report(self) -> str:
+        r"""
+        #### Returns the summary as a table (in milliseconds)
+        """
+        lines = [f"{'phase':<10} {'p50':>8} {'p95':>8} {'p99':>8}   ({min(self.frames, self.size)} frames, ms)"]
+
+        for phase, values in self.summary().items():
+            lines.append(
+                f"{phase:<10} {values['p50'] * 1000:>8.3f} {values['p95'] * 1000:>8.3f} {values['p99'] * 1000:>8.3f}"
+            )
+
+        return "\n".join(lines)
+
+    def clear(self) -> None:
+        r"""
+        #### Removes all the recorded frames
+        """
+        self.frames = 0
+
+        for phase in self.PHASES:
+            self._current[phase] = 0.0
+
+
+class SamplingProfiler:
+    r"""
+    #### Sampling Profiler
+    Low overhead alternative to `cProfile`, a background thread takes a snapshot of the main thread stack
+    every `interval` seconds, the game code is not instrumented so frame pacing stays the same.
+
+    - Samples are aggregated per frame (`next_frame` is called by `Window.update`) and then added to the totals.
+    - `dump` writes the stacks in the collapsed format used by flamegraph tools (`flamegraph.pl`, speedscope, inferno, ...)
+
+    #### Parameters
+    - `interval` : time between samples in seconds
+    - `thread_id` : thread to sample (default: thread that creates the profiler)
+    """
+
+    __slots__ = (
+        "interval",
+        "thread_id",
+        "frames",
+        "max_frame_samples",
+        "_totals",
+        "_current",
+        "_labels",
+        "_lock",
+        "_stop",
+        "_thread",
+    )
+
+    def __init__(self, interval: float = 0.005, thread_id: int | None = None):
+        self.interval: float = interval
+        self.thread_id: int = thread_id or get_ident()
+
+        self.frames: int = 0
+        self.max_frame_samples: int = 0 # samples taken during the slowest frame
+
+        self._totals: Counter = Counter()
+        self._current: Counter = Counter()
+        self._labels: Dict = {} # code object -> label cache
+        self._lock = Lock()
+        self._stop = Event()
+        self._thread: Thread | None = None
+
+    def start(self) -> None:
+        r"""
+        #### Starts sampling in a background thread
+        """
+        self._stop.clear()
+        self._thread = Thread(target=self._run, name="ezsgame-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        r"""
+        #### Stops sampling, samples of the current frame are added to the totals
+        """
+        self._stop.set()
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        self.next_frame()
+
+    def next_frame(self) -> None:
+        r"""
+        #### Adds the samples of the current frame to the totals
+        """
+        with self._lock:
+            current, self._current = self._current, Counter()
+
+        samples = sum(current.values())
+        if samples > self.max_frame_samples:
+            self.max_frame_samples = samples
+
+        self._totals.update(current)
+        self.frames += 1
+
+    def _run(self) -> None:
+        wait = self._stop.wait
+
+        while not wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+
+            stack = self._get_stack(frame)
+
+            with self._lock:
+                self._current[stack] += 1
+
+    def _get_stack(self, frame) -> Tuple[str, ...]:
+        labels = self._labels
+        stack = []
+
+        while frame is not None:
+            code = frame.f_code
+            label = labels.get(code)
+
+            if label is None:
+                label = labels[code] = (
+                    f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+                )
+
+            stack.append(label)
+            frame = frame.f_back
+
+        # root first
+        stack.reverse()
+        return tuple(stack)
+
+    def get_stacks(self) -> Counter:
+        r"""
+        #### Returns the sampled stacks and how many times each one was sampled
+        """
+        return self._totals.copy()
+
+    def dump(self, file: str) -> None:
+        r"""
+        #### Writes the samples in collapsed stack format (`root;child;leaf count` per line)
+        """
+        with open(file, "w", encoding="utf-8") as f:
+            for stack, count in self._totals.most_common():
+                f.write(f"{';'.join(stack)} {count}\n")
+
+    def report(self, limit: int = 10) -> str:
+        r"""
+        #### Returns the functions where most samples where taken (self time)
+        """
+        total = sum(self._totals.values())
+        leaves = Counter()
+
+        for stack, count in self._totals.items():
+            leaves[stack[-1]] += count
+
+        lines = [
+            f"{total} samples in {self.frames} frames ({self.interval * 1000:g}ms interval, max {self.max_frame_samples} samples per frame)"
+        ]
+
+        for label, count in leaves.most_common(limit):
+            lines.append(f"{count / (total or 1) * 100:>6.2f}%  {count:>7}  {label}")
+
+        return "\n".join(lines)
@@ -0,0 +1,423 @@
+"""
+Module for rendering helpers used by the window (dirty regions tracking, render order, batched drawing, etc.)
+"""
+
+from bisect import bisect_left, bisect_right
+from itertools import count
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+import pygame as pg
+
+
+class DirtyRegions:
+    r"""
+    #### Dirty Regions
+    Keeps track of the screen regions that changed during the current frame, so `Window.update` only
+    has to present those regions instead of the whole framebuffer.
+
+    - Objects report their bounds every time they are drawn, if the bounds or the draw state (color, stroke, visibility, surface, ...)
+      changed since the last draw, both the old and the new bounds are marked as dirty.
+    - `show` : if True, the dirty regions will be outlined on the screen (debug overlay)
+    - `color` : color of the debug overlay
+    - `max_rects` : if more regions than this are dirty in a frame, the whole screen is presented instead
+    """
+
+    __slots__ = ("rects", "full", "show", "color", "max_rects", "background", "_shown")
+
+    def __init__(self, show: bool = False, color="red", max_rects: int = 64):
+        self.rects: List[pg.Rect] = []
+        self.full: bool = True # first frame is always fully presented
+        self.show: bool = show
+        self.color = color
+        self.max_rects: int = max_rects
+        self.background: Any = None
+        self._shown: List[pg.Rect] = []
+
+    def add(self, rect) -> None:
+        r"""
+        #### Marks a region of the screen as dirty
+        - `rect` : region to mark `(x, y, width, height)` or `pg.Rect`
+        """
+        if self.full:
+            return
+
+        # inflate a bit to cover float truncation and antialiasing
+        rect = pg.Rect(rect).inflate(2, 2)
+        if rect.width > 0 and rect.height > 0:
+            self.rects.append(rect)
+
+    def invalidate(self) -> None:
+        r"""
+        #### Marks the whole screen as dirty
+        """
+        self.full = True
+        self.rects.clear()
+
+    def track(self, obj, bounds: Tuple, state: Tuple) -> None:
+        r"""
+        #### Compares the object draw state with the one of its last draw, marks old and new bounds as dirty if they changed
+        - `obj` : object being drawn (must have a `_draw_state` attribute)
+        - `bounds` : current bounds of the object `(x, y, width, height)`
+        - `state` : anything that changes the way the object looks (color, surface, etc.)
+        """
+        last = obj._draw_state
+
+        if last is not None and last[0] == bounds and last[1] == state:
+            return
+
+        if last is not None:
+            self.add(last[0])
+
+        self.add(bounds)
+        obj._draw_state = (bounds, state)
+
+    def set_background(self, background) -> None:
+        r"""
+        #### Called when the window is filled, if the fill changed the whole screen is dirty
+        """
+        if background is not self.background and background != self.background:
+            self.background = background
+            self.invalidate()
+
+    def flush(self, surface: pg.Surface) -> List[pg.Rect] | None:
+        r"""
+        #### Returns the regions to present for this frame and resets the tracker
+        Returns `None` if the whole screen should be presented.
+        """
+        if self.full or len(self.rects) > self.max_rects:
+            self.full = False
+            self.rects.clear()
+            self._shown.clear()
+            return None
+
+        rects = self._merge(self.rects)
+        self.rects = []
+
+        if self.show:
+            for rect in rects:
+                pg.draw.rect(surface, self.color, rect, 1)
+
+            # previous outlines have to be presented again to be erased
+            shown, self._shown = self._shown, rects
+            return rects + shown
+
+        return rects
+
+    @staticmethod
+    def _merge(rects: List[pg.Rect]) -> List[pg.Rect]:
+        r"""
+        #### Merges overlapping regions into their union
+        """
+        merged: List[pg.Rect] = []
+
+        for rect in rects:
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect = rect.union(merged.pop(index))
+                index = rect.collidelist(merged)
+
+            merged.append(rect)
+
+        return merged
+
+
+class RenderList:
+    r"""
+    #### Render List
+    Objects sorted by `styles.z_index` (render order), objects with the same z-index keep the order they were added in.
+
+    - Insert and remove use binary search over the `(z_index, order)` keys.
+    - If the `z_index` of an object changes it is moved to its new place (on `draw`, or by calling `restack`)
+    - Objects outside of the `view` passed to `draw` are not drawn (culling)
+    - Consecutive objects that are just an image are drawn with a single `Surface.blits` call (see `draw_batched`)
+    - Objects in a static `RenderLayer` (`styles.layer`) are drawn from the layer cache, when the first of them is reached
+    """
+
+    __slots__ = ("_keys", "_objects", "_index", "_counter", "layers")
+
+    def __init__(self):
+        self._keys: List[Tuple[int, int]] = []
+        self._objects: List[Any] = []
+        self._index: Dict[Any, Tuple[int, int]] = {}
+        self._counter = count()
+        self.layers: Dict[str, RenderLayer] = {}
+
+    def add_layer(self, name: str, static: bool = False, watch: bool = True) -> "RenderLayer":
+        r"""
+        #### Creates a render layer, objects join it through `styles.layer` (see `RenderLayer`)
+        """
+        if name in self.layers:
+            raise ValueError(f"Render layer \"{name}\" already exists")
+
+        layer = self.layers[name] = RenderLayer(name, static, watch)
+        return layer
+
+    def _invalidate_layer(self, obj) -> None:
+        layer = self.layers.get(obj.styles.layer) if self.layers else None
+        if layer is not None:
+            layer.invalidate()
+
+    def add(self, obj) -> None:
+        r"""
+        #### Adds an object at the end of its z-index level
+        """
+        if obj in self._index:
+            return
+
+        key = (obj.styles.z_index, next(self._counter))
+        index = bisect_right(self._keys, key)
+
+        self._keys.insert(index, key)
+        self._objects.insert(index, obj)
+        self._index[obj] = key
+
+        self._invalidate_layer(obj)
+
+    def remove(self, obj) -> None:
+        r"""
+        #### Removes an object from the list (does nothing if the object is not in the list)
+        """
+        key = self._index.pop(obj, None)
+        if key is None:
+            return
+
+        index = bisect_left(self._keys, key)
+        del self._keys[index]
+        del self._objects[index]
+
+        self._invalidate_layer(obj)
+
+    def restack(self, obj) -> None:
+        r"""
+        #### Moves an object to the place of its current z-index
+        """
+        self.remove(obj)
+        self.add(obj)
+
+    def draw(self, surface: pg.Surface, view: Tuple[float, float, float, float] | None = None) -> None:
+        r"""
+        #### Draws all objects in render order
+        - `surface` : surface where batched objects are blitted (the surface the objects draw to)
+        - `view` : if passed, objects whose bounds don't touch `(left, top, right, bottom)` are skipped  (Optional)
+        """
+        changed = None
+        batch = []
+
+        layers = self.layers
+        drawn_layers = set()
+
+        if view is not None:
+            left, top, right, bottom = view
+
+        for key, obj in zip(self._keys, self._objects):
+            if key[0] != obj.styles.z_index:
+                if changed is None:
+                    changed = []
+                changed.append(obj)
+
+            if layers:
+                layer = layers.get(obj.styles.layer)
+
+                if layer is not None and layer.static:
+                    # the whole layer is drawn at the place of its first object
+                    if layer not in drawn_layers:
+                        if batch:
+                            surface.blits(batch, doreturn=False)
+                            batch.clear()
+
+                        layer.draw(self, surface)
+                        drawn_layers.add(layer)
+                    continue
+
+            if view is not None:
+                x, y, w, h = obj._get_bounds()
+
+                if x > right or y > bottom or x + w < left or y + h < top:
+                    # was drawn last frame (dirty rects mode), its old region has to be presented
+                    if obj._draw_state is not None:
+                        obj.window.dirty_regions.add(obj._draw_state[0])
+                        obj._draw_state = None
+                    continue
+
+            get_blit = obj._get_blit
+            if get_blit is not None and _batchable(type(obj)):
+                blit = get_blit()
+
+                if blit is not None:
+                    batch.append(blit)
+
+                    if obj.window.dirty_regions is not None:
+                        obj.window.dirty_regions.track(obj, obj._get_bounds(), obj._get_draw_state())
+                    continue
+
+            # keep z-order, everything batched so far goes first
+            if batch:
+                surface.blits(batch, doreturn=False)
+                batch.clear()
+
+            obj.draw()
+
+        if batch:
+            surface.blits(batch, doreturn=False)
+
+        # objects whose z-index changed are moved after drawing to not modify the list while iterating
+        if changed is not None:
+            for obj in changed:
+                self.restack(obj)
+
+    def __iter__(self) -> Iterator:
+        return iter(self._objects)
+
+    def get_layer_objects(self, name: str) -> List[Any]:
+        r"""
+        #### Returns the objects of a layer in render order
+        """
+        return [obj for obj in self._objects if obj.styles.layer == name]
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def __contains__(self, obj) -> bool:
+        return obj in self._index
+
+    def __getitem__(self, index):
+        return self._objects[index]
+
+
+class RenderLayer:
+    r"""
+    #### Render Layer
+    Named group of objects, objects join a layer through the `layer` style `Rect(..., layer="background")`.
+    Create layers with `World.add_layer`.
+
+    - Dynamic layers (default) are drawn every frame like any other object.
+    - Static layers are drawn once into an offscreen surface, after that the surface is blitted with a single call
+    until the layer is invalidated. Layers are invalidated when objects join or leave them, when the window is resized, when `invalidate` is called and,
+    if `watch` is True, when the bounds or draw state (color, surface, ...) of one of their objects changes.
+
+    #### Parameters
+    - `name` : name of the layer
+    - `static` : if True, the layer is cached
+    - `watch` : if True, objects of the layer are checked every frame for changes (static layers)
+    """
+
+    __slots__ = ("name", "static", "watch", "surface", "renders", "_valid", "_objects", "_states")
+
+    def __init__(self, name: str, static: bool = False, watch: bool = True):
+        self.name: str = name
+        self.static: bool = static
+        self.watch: bool = watch
+
+        self.surface: pg.Surface | None = None
+        self.renders: int = 0 # number of times the cache was drawn
+
+        self._valid: bool = False
+        self._objects: List[Any] = []
+        self._states: List[Tuple] = []
+
+    def invalidate(self) -> None:
+        r"""
+        #### Makes the layer draw its objects again on the next frame
+        """
+        self._valid = False
+
+    def _changed(self) -> bool:
+        for obj, state in zip(self._objects, self._states):
+            if obj._get_bounds() != state[0] or obj._get_draw_state() != state[1]:
+                return True
+
+        return False
+
+    def draw(self, render_list: RenderList, surface: pg.Surface) -> None:
+        r"""
+        #### Blits the layer cache into `surface`, the cache is drawn first if the layer is not valid
+        """
+        size = surface.get_size()
+
+        if self._valid and self.watch and self._changed():
+            self._valid = False
+
+        # the window was resized
+        elif self._valid and self.surface is not None and self.surface.get_size() != size:
+            self._valid = False
+
+        if not self._valid:
+            self._render(render_list, size)
+
+        if self._objects:
+            surface.blit(self.surface, (0, 0))
+
+    def _render(self, render_list: RenderList, size: Tuple[int, int]) -> None:
+        self._objects = render_list.get_layer_objects(self.name)
+        self._valid = True
+
+        if not self._objects:
+            return
+
+        if self.surface is None or self.surface.get_size() != size:
+            self.surface = pg.Surface(size, pg.SRCALPHA)
+
+        self.surface.fill((0, 0, 0, 0))
+
+        # objects draw into the window surface, so it's replaced by the cache while drawing
+        window = self._objects[0].window
+        window_surface, window.surface = window.surface, self.surface
+
+        try:
+            draw_batched(self._objects, self.surface)
+        finally:
+            window.surface = window_surface
+
+        if self.watch:
+            self._states = [(obj._get_bounds(), obj._get_draw_state()) for obj in self._objects]
+
+        self.renders += 1
+
+
+_batchable_types: Dict[type, bool] = {}
+
+def _batchable(cls: type) -> bool:
+    # the blit returned by `_get_blit` stands for `draw`, it can't be used if a subclass overrides `draw` and not `_get_blit`
+    batchable = _batchable_types.get(cls)
+
+    if batchable is None:
+        mro = cls.__mro__
+        draw_owner = next(i for i, base in enumerate(mro) if "draw" in vars(base))
+        blit_owner = next(i for i, base in enumerate(mro) if "_get_blit" in vars(base))
+
+        batchable = _batchable_types[cls] = blit_owner <= draw_owner
+
+    return batchable
+
+
+def draw_batched(objects: Iterable, surface: pg.Surface) -> None:
+    r"""
+    #### Draws objects in the given order, consecutive objects that are just an image (`Image`, `Text`, `Sprite`, `AnimatedSprite`)
+    are drawn with a single `Surface.blits` call instead of one `blit` per object
+    - `objects` : objects to draw
+    - `surface` : surface to draw in (usually `window.surface`)
+
+    Note: objects with `on_draw` listeners or that are not visible, and subclasses that override `draw`, are drawn through their `draw` method
+    """
+    batch = []
+
+    for obj in objects:
+        get_blit = getattr(obj, "_get_blit", None)
+
+        if get_blit is not None and _batchable(type(obj)):
+            blit = get_blit()
+
+            if blit is not None:
+                batch.append(blit)
+
+                if obj.window.dirty_regions is not None:
+                    obj.window.dirty_regions.track(obj, obj._get_bounds(), obj._get_draw_state())
+                continue
+
+        if batch:
+            surface.blits(batch, doreturn=False)
+            batch.clear()
+
+        obj.draw()
+
+    if batch:
+        surface.blits(batch, doreturn=False)
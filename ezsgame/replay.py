@@ -0,0 +1,361 @@
+"""
+Module for recording the input and time of a session and replaying it (reproducible runs and benchmarks)
+"""
+
+from array import array
+from time import perf_counter
+from typing import BinaryIO, Callable, Dict, FrozenSet, List, Tuple
+import marshal, struct
+import pygame as pg
+
+from .event_handler import EventHandler
+from .time_handler import TimeHandler
+from .clock import Clocks
+from .world import World
+
+
+MAGIC = b"EZSREC"
+VERSION = 1
+
+# frame : ticks (ms), delta time (s), number of events
+_FRAME = struct.Struct("<IdH")
+
+# event : type, payload size
+_EVENT = struct.Struct("<IH")
+
+# payload of the most common events, any other event is stored as a marshaled dict of its attributes
+_MOTION = struct.Struct("<hhhhB") # pos, rel, buttons (bitmask)
+_BUTTON = struct.Struct("<hhB") # pos, button
+_WHEEL = struct.Struct("<hhffB") # x, y, precise_x, precise_y, flipped
+_KEY = struct.Struct("<iHiB") # key, mod, scancode, unicode size (followed by unicode as utf-8)
+
+
+def _encode(ev: pg.event.Event) -> bytes:
+    t = ev.type
+    d = ev.__dict__
+
+    if t == pg.MOUSEMOTION:
+        buttons = d.get("buttons", (0, 0, 0))
+        return _MOTION.pack(
+            *ev.pos, *ev.rel, sum(1 << i for i, pressed in enumerate(buttons) if pressed)
+        )
+
+    if t in (pg.MOUSEBUTTONDOWN, pg.MOUSEBUTTONUP):
+        return _BUTTON.pack(*ev.pos, ev.button)
+
+    if t == pg.MOUSEWHEEL:
+        return _WHEEL.pack(
+            ev.x, ev.y, d.get("precise_x", ev.x), d.get("precise_y", ev.y), d.get("flipped", False)
+        )
+
+    if t in (pg.KEYDOWN, pg.KEYUP):
+        text = d.get("unicode", "").encode("utf-8")
+        return _KEY.pack(ev.key, d.get("mod", 0), d.get("scancode", 0), len(text)) + text
+
+    # anything that can't be marshaled (window references, etc.) is dropped
+    try:
+        return marshal.dumps(d)
+    except ValueError:
+        return marshal.dumps({k: v for k, v in d.items() if isinstance(v, (int, float, str, bool, tuple))})
+
+
+def _decode(t: int, payload: bytes) -> pg.event.Event:
+    if t == pg.MOUSEMOTION:
+        x, y, rx, ry, buttons = _MOTION.unpack(payload)
+        return pg.event.Event(
+            t, pos=(x, y), rel=(rx, ry), buttons=tuple(int(bool(buttons & (1 << i))) for i in range(3)), touch=False
+        )
+
+    if t in (pg.MOUSEBUTTONDOWN, pg.MOUSEBUTTONUP):
+        x, y, button = _BUTTON.unpack(payload)
+        return pg.event.Event(t, pos=(x, y), button=button, touch=False)
+
+    if t == pg.MOUSEWHEEL:
+        x, y, precise_x, precise_y, flipped = _WHEEL.unpack(payload)
+        return pg.event.Event(
+            t, x=x, y=y, precise_x=precise_x, precise_y=precise_y, flipped=bool(flipped), touch=False, which=0
+        )
+
+    if t in (pg.KEYDOWN, pg.KEYUP):
+        key, mod, scancode, size = _KEY.unpack_from(payload)
+        text = payload[_KEY.size : _KEY.size + size].decode("utf-8")
+        return pg.event.Event(t, key=key, mod=mod, scancode=scancode, unicode=text)
+
+    return pg.event.Event(t, marshal.loads(payload))
+
+
+class InputRecorder:
+    r"""
+    #### Input Recorder
+    Writes the events, ticks and delta time of every frame into a compact binary file, to be played back with `Replay`.
+
+    #### Example
+    ```python
+    window = Window()
+    recorder = InputRecorder("session.ezsrec")
+    recorder.start()
+
+    window.run(update) # the file is closed on `window.quit()`
+    ```
+    """
+
+    __slots__ = ("file", "frames", "_stream", "_frame")
+
+    def __init__(self, file: str):
+        self.file: str = file
+        self.frames: int = 0
+
+        self._stream: BinaryIO | None = None
+        self._frame: Tuple[int, float] | None = None
+
+    def start(self) -> None:
+        r"""
+        #### Starts recording (`TimeHandler` and `EventHandler` send every frame to the recorder)
+        """
+        self._stream = open(self.file, "wb")
+        self._stream.write(MAGIC + bytes((VERSION,)))
+
+        TimeHandler.recorder = self
+        EventHandler.recorder = self
+
+    def stop(self) -> None:
+        r"""
+        #### Stops recording and closes the file
+        """
+        if TimeHandler.recorder is self:
+            TimeHandler.recorder = None
+        if EventHandler.recorder is self:
+            EventHandler.recorder = None
+
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+    def begin_frame(self, ticks: int) -> None:
+        r"""
+        #### Called by `TimeHandler.check`, stores the time of the frame
+        The delta time is the real frame time (`Clocks.real`, not the fixed timestep, so fixed loops replay the same updates)
+        """
+        self._frame = (ticks, Clocks.real.delta_time)
+
+    def add_events(self, events: List[pg.event.Event]) -> None:
+        r"""
+        #### Called by `EventHandler.check`, writes the frame with its events
+        """
+        if self._stream is None:
+            return
+
+        ticks, delta_time = self._frame or (pg.time.get_ticks(), 0.0)
+        self._frame = None
+
+        chunks = [_FRAME.pack(ticks, delta_time, len(events))]
+        for ev in events:
+            payload = _encode(ev)
+            chunks.append(_EVENT.pack(ev.type, len(payload)))
+            chunks.append(payload)
+
+        self._stream.write(b"".join(chunks))
+        self.frames += 1
+
+
+class ReplayFinished(Exception):
+    r"""
+    #### Raised by `TimeHandler.check` when all the frames of a replay were played
+    """
+
+
+class _ReplayKeys:
+    # stands for `pg.key.get_pressed()` during a replay, a new one is made every frame (the previous frame keeps its own)
+    __slots__ = ("down",)
+
+    def __init__(self, down: FrozenSet[int] = frozenset()):
+        self.down: FrozenSet[int] = down
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self.down
+
+
+class Replay:
+    r"""
+    #### Replay
+    Plays back a file written by `InputRecorder`: `Clocks` and `EventHandler` take delta time, events, pressed keys
+    and mouse position from the file instead of pygame, and frames run as fast as possible.
+    When the last frame was played `ReplayFinished` is raised, `run` catches it and returns the frame time report.
+
+    #### Example
+    ```python
+    window = Window(headless=True)
+
+    replay = Replay("session.ezsrec")
+    print(replay.run(lambda: window.run(update)))
+    ```
+
+    Note: keys pressed before the recording started are not known by the replay
+    """
+
+    __slots__ = (
+        "file",
+        "frames",
+        "ticks",
+        "delta_time",
+        "events",
+        "keys",
+        "mouse_pos",
+        "buttons",
+        "frame_times",
+        "_data",
+        "_offset",
+        "_last",
+        "_fps",
+    )
+
+    def __init__(self, file: str):
+        self.file: str = file
+
+        with open(file, "rb") as f:
+            self._data: bytes = f.read()
+
+        if not self._data.startswith(MAGIC):
+            raise ValueError(f"{file} is not an ezsgame input recording")
+
+        if self._data[len(MAGIC)] != VERSION:
+            raise ValueError(f"{file} was recorded with an unsupported version ({self._data[len(MAGIC)]})")
+
+        self.frames: int = 0 # played frames
+        self.ticks: int = 0
+        self.delta_time: float = 0.0
+        self.events: List[pg.event.Event] = []
+        self.keys = _ReplayKeys()
+        self.mouse_pos: Tuple[int, int] = (0, 0)
+        self.buttons: Tuple[bool, ...] = (False,) * 5 # stands for `pg.mouse.get_pressed(5)`
+
+        # time (seconds) each played frame took
+        self.frame_times = array("d")
+
+        self._offset: int = len(MAGIC) + 1
+        self._last: float | None = None
+        self._fps: int | None = None
+
+    def start(self) -> None:
+        r"""
+        #### Starts the replay (the window fps is set to `0` so frames aren't waited)
+        """
+        TimeHandler.replay = self
+        EventHandler.replay = self
+
+        window = World.window
+        if hasattr(window, "fps"):
+            self._fps = window.fps
+            window.fps = 0
+
+    def stop(self) -> None:
+        r"""
+        #### Stops the replay, the window gets its fps back
+        """
+        if TimeHandler.replay is self:
+            TimeHandler.replay = None
+        if EventHandler.replay is self:
+            EventHandler.replay = None
+
+        if self._fps is not None:
+            World.window.fps = self._fps
+            self._fps = None
+
+    def run(self, main: Callable[[], None]) -> str:
+        r"""
+        #### Starts the replay, calls `main` (the main loop) until the replay finishes, returns the frame time report
+        """
+        self.start()
+
+        try:
+            main()
+        except ReplayFinished:
+            pass
+        finally:
+            self.stop()
+
+        return self.report()
+
+    def next_frame(self) -> None:
+        r"""
+        #### Called by `TimeHandler.check`, loads the next frame (raises `ReplayFinished` after the last one)
+        """
+        now = perf_counter()
+        if self._last is not None:
+            self.frame_times.append(now - self._last)
+        self._last = now
+
+        data = self._data
+        if self._offset >= len(data):
+            raise ReplayFinished()
+
+        self.ticks, self.delta_time, count = _FRAME.unpack_from(data, self._offset)
+        self._offset += _FRAME.size
+
+        events = []
+        keys = set(self.keys.down)
+        buttons = list(self.buttons)
+
+        for _ in range(count):
+            t, size = _EVENT.unpack_from(data, self._offset)
+            self._offset += _EVENT.size
+
+            ev = _decode(t, data[self._offset : self._offset + size])
+            self._offset += size
+
+            if t == pg.KEYDOWN:
+                keys.add(ev.key)
+            elif t == pg.KEYUP:
+                keys.discard(ev.key)
+            elif t == pg.MOUSEMOTION:
+                self.mouse_pos = ev.pos
+            elif t in (pg.MOUSEBUTTONDOWN, pg.MOUSEBUTTONUP) and 1 <= ev.button <= 5:
+                buttons[ev.button - 1] = t == pg.MOUSEBUTTONDOWN
+
+            events.append(ev)
+
+        # new objects, the states of the previous frame (`EventHandler.previous_keys`) must not change
+        self.keys = _ReplayKeys(frozenset(keys))
+        self.buttons = tuple(buttons)
+
+        self.events = events
+        self.frames += 1
+
+    def percentile(self, percent: float) -> float:
+        r"""
+        #### Returns the given percentile (`0` - `100`) of the frame times, in seconds
+        """
+        values = sorted(self.frame_times)
+        if not values:
+            return 0.0
+
+        return values[round(percent / 100 * (len(values) - 1))]
+
+    def summary(self) -> Dict[str, float]:
+        r"""
+        #### Returns frame time statistics, in seconds
+        `{"frames" : 600, "total" : 1.2, "mean" : 0.002, "p50" : ..., "p95" : ..., "p99" : ..., "max" : ...}`
+        """
+        times = self.frame_times
+        total = sum(times)
+
+        return {
+            "frames": len(times),
+            "total": total,
+            "mean": total / len(times) if times else 0.0,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": max(times, default=0.0),
+        }
+
+    def report(self) -> str:
+        r"""
+        #### Returns the frame time statistics as text (in milliseconds)
+        """
+        s = self.summary()
+        return (
+            f"{s['frames']} frames in {s['total'] * 1000:.1f}ms  "
+            + "  ".join(f"{k} {s[k] * 1000:.3f}" for k in ("mean", "p50", "p95", "p99", "max"))
+            + "  (ms)"
+        )
@@ -1,5 +1,4 @@
 from typing import Optional
-from unittest.mock import DEFAULT
 import pygame as pg
 
 class Mixer:
@@ -39,7 +38,25 @@ class Mixer:
         for sound in self.sounds:
             del sound
   
-DEFAULT_MIXER = Mixer()
+_default_mixer: Mixer | None = None
+
+def get_default_mixer() -> Mixer:
+    r"""
+    #### Returns the default mixer, the mixer (and audio device) is initialized the first time it's needed
+    """
+    global _default_mixer
+
+    if _default_mixer is None:
+        _default_mixer = Mixer()
+
+    return _default_mixer
+
+def __getattr__(name: str):
+    # `DEFAULT_MIXER` is created on first access
+    if name == "DEFAULT_MIXER":
+        return get_default_mixer()
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 class Sound:
     def __init__(self, file, mixer: Mixer | None = None):
@@ -50,7 +67,7 @@ class Sound:
         
         self.sound.set_volume(0.5)
         
-        self.mixer = mixer or DEFAULT_MIXER
+        self.mixer = mixer or get_default_mixer()
         
         self.mixer._load_sound(self)
         self.length = self.sound.get_length()
@@ -0,0 +1,141 @@
+"""
+Module for spatial indexing (finding the objects under a point without checking every object)
+"""
+
+from itertools import count
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+
+class SpatialGrid:
+    r"""
+    #### Spatial Grid
+    Uniform grid over the collision boxes of a set of objects, used by `EventHandler` to find the objects under the mouse.
+
+    - Each object is stored in every cell its collision box touches, a query only checks the objects of one cell.
+    - Objects can move at any time, `refresh` moves the objects whose collision box changed since the last refresh.
+
+    #### Parameters
+    - `cell_size` : size of the cells in pixels
+    """
+
+    __slots__ = ("cell_size", "cells", "_boxes", "_order", "_counter")
+
+    def __init__(self, cell_size: int = 64):
+        self.cell_size: int = cell_size
+        self.cells: Dict[Tuple[int, int], Set[Any]] = {}
+
+        self._boxes: Dict[Any, Tuple[float, float, float, float]] = {} # object -> (left, top, right, bottom)
+        self._order: Dict[Any, int] = {} # object -> insertion order
+        self._counter = count()
+
+    def _get_cells(self, box: Tuple[float, float, float, float]) -> Iterable[Tuple[int, int]]:
+        size = self.cell_size
+        left, top, right, bottom = box
+
+        for cx in range(int(left // size), int(right // size) + 1):
+            for cy in range(int(top // size), int(bottom // size) + 1):
+                yield (cx, cy)
+
+    @staticmethod
+    def _get_box(obj) -> Tuple[float, float, float, float]:
+        box = obj._get_collision_box()
+        return (box[0][0], box[0][1], box[3][0], box[3][1])
+
+    def insert(self, obj) -> None:
+        r"""
+        #### Adds an object to the grid (does nothing if the object is already in the grid)
+        """
+        if obj in self._boxes:
+            return
+
+        box = self._boxes[obj] = self._get_box(obj)
+        self._order[obj] = next(self._counter)
+
+        for cell in self._get_cells(box):
+            self.cells.setdefault(cell, set()).add(obj)
+
+    def remove(self, obj) -> None:
+        r"""
+        #### Removes an object from the grid (does nothing if the object is not in the grid)
+        """
+        box = self._boxes.pop(obj, None)
+        if box is None:
+            return
+
+        del self._order[obj]
+
+        for cell in self._get_cells(box):
+            objects = self.cells.get(cell)
+
+            if objects is not None:
+                objects.discard(obj)
+                if not objects:
+                    del self.cells[cell]
+
+    def sync(self, objects: Iterable) -> None:
+        r"""
+        #### Makes the grid contain exactly the given objects
+        """
+        objects = list(objects)
+        members = set(objects)
+
+        for obj in [obj for obj in self._boxes if obj not in members]:
+            self.remove(obj)
+
+        # inserted in the given (creation) order, `_order` breaks z-index ties
+        for obj in objects:
+            self.insert(obj)
+
+    def refresh(self, objects: Iterable | None = None) -> bool:
+        r"""
+        #### Moves the objects whose collision box changed to their new cells, returns `True` if any object moved
+        - `objects` : only these objects are checked (Optional, every object in the grid by default)
+        """
+        get_box = self._get_box
+        boxes = self._boxes
+
+        if objects is None:
+            moved = [obj for obj, box in boxes.items() if get_box(obj) != box]
+        else:
+            moved = [obj for obj in objects if obj in boxes and get_box(obj) != boxes[obj]]
+
+        for obj in moved:
+            order = self._order[obj]
+            self.remove(obj)
+            self.insert(obj)
+            self._order[obj] = order
+
+        return bool(moved)
+
+    def query(self, x: float, y: float) -> List[Any]:
+        r"""
+        #### Returns the objects whose collision box contains the point `(x, y)` (edges excluded, same as `EventHandler.is_hovering`)
+        """
+        size = self.cell_size
+        objects = self.cells.get((int(x // size), int(y // size)))
+
+        if not objects:
+            return []
+
+        boxes = self._boxes
+        hits = []
+
+        for obj in objects:
+            left, top, right, bottom = boxes[obj]
+            if left < x < right and top < y < bottom:
+                hits.append(obj)
+
+        return hits
+
+    def topmost(self, objects: Iterable) -> Any:
+        r"""
+        #### Returns the object drawn on top (highest `z_index`, the last added one for equal `z_index`), `None` if there are no objects
+        """
+        order = self._order
+        return max(objects, key=lambda obj: (obj.styles.z_index, order[obj]), default=None)
+
+    def __len__(self) -> int:
+        return len(self._boxes)
+
+    def __contains__(self, obj) -> bool:
+        return obj in self._boxes
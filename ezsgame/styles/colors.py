@@ -103,10 +103,21 @@ class Gradient:
                 "You must specify at least two colors to create a gradient")
 
         self.colors = colors
+        self.direction = direction
+        self.complexity = complexity
 
         self.window = get_window()
+        self._surface: pg.Surface | None = None # stripes are drawn once and cached here
+
+        # without a size the gradient follows the window size
+        self.size = Size(size) if size else None
+        self._build(self.size or self.window.size)
+
+    def _build(self, size):
+        colors = self.colors
+        complexity = self.complexity
+        direction = self.direction
 
-        size = resolve_size(size) if size else self.window.size
         self.gradient_objs = []
         last_color = None
 
@@ -127,8 +138,19 @@ class Gradient:
                                       )
 
     def draw(self):
-        for obj in self.gradient_objs:
-            pg.draw.rect(self.window.surface, obj[2], pg.Rect(obj[0], obj[1]))
+        size = tuple(self.size) if self.size else self.window.surface.get_size()
+
+        if self._surface is None or self._surface.get_size() != size:
+            # the window was resized
+            if not self.size and self._surface is not None:
+                self._build(size)
+
+            self._surface = pg.Surface(size)
+
+            for obj in self.gradient_objs:
+                pg.draw.rect(self._surface, obj[2], pg.Rect(obj[0], obj[1]))
+
+        self.window.surface.blit(self._surface, (0, 0))
 
     def __str__(self):
         return f"<Gradient {self.colors}>"
@@ -19,6 +19,7 @@ class Styles:
     
     stroke: int = 0
     z_index: int = 0
+    layer: str | None = None # name of the render layer (see `World.add_layer`)
 
     # bools
     visible: bool = True
@@ -1,12 +1,21 @@
-from typing import Callable, List
+from heapq import heapify, heappop, heappush
+from itertools import count
+from typing import Callable, Dict, Generator, List, Tuple
 import pygame as pg
 
+from .types import Signal
+from .clock import Clocks
+
+
+# what a fixed schedule interval does when it missed several periods (a long frame, the window was dragged, etc.)
+CATCH_UP_POLICIES = ("skip", "all")
+
 
 class Interval:
-    __slots__ = "time", "callback", "name", "last_call", "repeat"
+    __slots__ = "time", "callback", "name", "last_call", "repeat", "due", "fixed", "catch_up"
 
     def __init__(
-        self, time: float, callback: Callable, last_call: float, name, repeat: int
+        self, time: float, callback: Callable, last_call: float, name, repeat: int, fixed: bool = False, catch_up: str = "skip"
     ):
         self.time = time
         self.callback = callback
@@ -14,30 +23,100 @@ class Interval:
         self.last_call = last_call
         self.repeat = repeat
 
+        self.due: float = 0 # time (ms) of the next call
+        self.fixed = fixed
+        self.catch_up = catch_up
+
+
+class Frames:
+    r"""
+    #### Yielded by a coroutine to wait a number of frames (`yield Frames(3)`, `yield` alone waits one frame)
+    """
+
+    __slots__ = ("count",)
+
+    def __init__(self, count: int = 1):
+        self.count: int = count
+
+
+class Coroutine:
+    r"""
+    #### Coroutine
+    Generator run by `TimeHandler`, it's resumed only when what it yielded is done:
+    - `yield 0.5` : waits 0.5 seconds
+    - `yield Frames(3)` : waits 3 frames (`yield` alone waits one frame)
+    - `yield signal` : waits until the `Signal` is triggered (the value of the yield is the trigger argument, a tuple if there
+      are several)
+
+    Waiting coroutines are kept in the interval heap, a frame heap or the wait list of the signal, so they cost nothing until they are resumed.
+    """
+
+    __slots__ = ("name", "generator", "running")
+
+    def __init__(self, generator: Generator, name: str):
+        self.name: str = name
+        self.generator: Generator = generator
+        self.running: bool = True
+
+    def stop(self) -> None:
+        r"""
+        #### Stops the coroutine (the generator is closed)
+        """
+        TimeHandler.stop_coroutine(self.name)
+
+    def __repr__(self) -> str:
+        return f"<Coroutine: {self.name}, running: {self.running}>"
+
 
 class TimeHandler:
     r"""
     - Handles the time events
+    - Intervals are indexed by name (in the order they were added), adding or removing an interval is O(1)
+    - Intervals wait in a heap by the time of their next call, so only the intervals that are due are visited each frame.
+      Removed or replaced intervals are dropped from the heap when they are reached (or when most of the heap is stale)
+    - By default the next call of an interval is `time` after the last one. Fixed schedule intervals (`fixed=True`) are called
+      at `start + n * time` (no drift), `catch_up` sets what happens when several calls were missed: `"skip"` calls once and
+      goes back to the schedule, `"all"` calls once per missed period
+    - Time is read from `Clocks.main`, so intervals and coroutines follow its scale and stop while it is paused
+    - Coroutines (`start_coroutine`) are generators resumed after the delay, frames or signal they yield (see `Coroutine`)
     """
 
-    intervals: List[Interval] = []
+    # input recording / replay (see `InputRecorder` and `Replay`)
+    recorder = None
+    replay = None
+
+    intervals: Dict[str, Interval] = {}
     to_remove: List[str] = []
+    to_remove_prefix: List[str] = []
     to_add: List[Interval] = []
 
-    def add(call_time: int, callback, name: str = "Default", repeat: int = -1):
+    _ids = count() # makes default interval names unique
+
+    _heap: List[Tuple[float, int, Interval]] = [] # (due, order, interval)
+    _order = count() # intervals due at the same time are called in the order they were scheduled
+    _stale: int = 0 # heap entries of removed or replaced intervals
+
+    coroutines: Dict[str, Coroutine] = {}
+    frame: int = 0 # number of checked frames
+    _frame_heap: List[Tuple[int, int, Coroutine]] = [] # (frame, order, coroutine)
+    _signals: Dict[Signal, List[Coroutine]] = {} # coroutines waiting for each signal
+
+    def add(call_time: int, callback, name: str = "Default", repeat: int = -1, fixed: bool = False, catch_up: str = "skip"):
         r"""
         #### Adds a `interval` that will be called every `time` seconds
         - `name` : name of the event
         - `time` : amount of time in seconds that the event will be called after
         - `callback` : function to be called when the event is triggered
         - `repeat` : number of times the interval will last (-1 for infinite)
+        - `fixed` : if True, the interval keeps a fixed schedule (calls don't drift with the frame time) (Optional)
+        - `catch_up` : if the interval is `fixed` and missed several calls, `"skip"` calls it once, `"all"` calls it once per missed call (Optional)
         """ 
 
         # convert time to milliseconds
         call_time *= 1000
 
         name = (
-            f"{len(TimeHandler.intervals)}.{call_time}" if name == "Default" else name
+            f"{next(TimeHandler._ids)}.{call_time}" if name == "Default" else name
         )
 
         # check for valid repeat
@@ -46,68 +125,295 @@ class TimeHandler:
                 f"At TimeHandler.add (Adding a interval): Argument `repeat` must be either -1 (infinite) or bigger than 0, got: {repeat}.\n For degubbing: TimeHandler.add({call_time=}, {callback=}, {name=}, {repeat=})"
             )
 
-        TimeHandler.to_add.append(Interval(call_time, callback, 0, name, repeat))
+        if catch_up not in CATCH_UP_POLICIES:
+            raise ValueError(
+                f"At TimeHandler.add (Adding a interval): Argument `catch_up` must be one of {CATCH_UP_POLICIES}, got: {catch_up!r}"
+            )
+
+        TimeHandler.to_add.append(Interval(call_time, callback, 0, name, repeat, fixed, catch_up))
 
-    def remove(name: str):
+    def remove(name: str, prefix: bool = False):
         r"""
         #### Removes an `interval` from the event list so it won't be called anymore
         - `name` : name of the event to be removed
+        - `prefix` : if True, every interval whose name starts with `name` is removed (Optional)
+        """
+        if prefix:
+            TimeHandler.to_remove_prefix.append(name)
+        else:
+            TimeHandler.to_remove.append(name)
+
+    def start_coroutine(generator: Generator, name: str = "Default") -> Coroutine:
+        r"""
+        #### Runs a generator until its first `yield`, then resumes it every time what it yielded is done (see `Coroutine`)
+        - `generator` : generator to run (the result of calling a generator function)
+        - `name` : name of the coroutine, a running coroutine with the same name is stopped (Optional)
+        """
+        name = f"coroutine.{next(TimeHandler._ids)}" if name == "Default" else name
+
+        if name in TimeHandler.coroutines:
+            TimeHandler.stop_coroutine(name)
+
+        coroutine = TimeHandler.coroutines[name] = Coroutine(generator, name)
+        TimeHandler._resume(coroutine, None)
+        return coroutine
+
+    def stop_coroutine(name: str, prefix: bool = False) -> None:
+        r"""
+        #### Stops a coroutine (does nothing if there is no coroutine with that name)
+        - `name` : name of the coroutine
+        - `prefix` : if True, every coroutine whose name starts with `name` is stopped (Optional)
         """
-        TimeHandler.to_remove.append(name)
+        coroutines = TimeHandler.coroutines
+        names = [n for n in coroutines if n.startswith(name)] if prefix else [name]
+
+        for n in names:
+            coroutine = coroutines.pop(n, None)
+
+            # waits are dropped when they are reached
+            if coroutine is not None:
+                coroutine.running = False
+                coroutine.generator.close()
+
+    def _resume(coroutine: Coroutine, value) -> None:
+        try:
+            wait = coroutine.generator.send(value)
+
+        except Exception as e:
+            # finished (or raised)
+            coroutine.running = False
+            if TimeHandler.coroutines.get(coroutine.name) is coroutine:
+                del TimeHandler.coroutines[coroutine.name]
+
+            if isinstance(e, StopIteration):
+                return
+            raise
+
+        if wait is None:
+            wait = Frames(1)
+
+        if isinstance(wait, Frames):
+            heappush(TimeHandler._frame_heap, (TimeHandler.frame + max(wait.count, 1), next(TimeHandler._order), coroutine))
+
+        elif isinstance(wait, Signal):
+            TimeHandler._wait_signal(coroutine, wait)
+
+        elif isinstance(wait, (int, float)):
+            heappush(TimeHandler._heap, (TimeHandler.get_ticks() + wait * 1000, next(TimeHandler._order), coroutine))
+
+        else:
+            TimeHandler.stop_coroutine(coroutine.name)
+            raise TypeError(
+                f"At coroutine \"{coroutine.name}\": expected a delay in seconds, `Frames` or `Signal` to be yielded, got: {wait!r}"
+            )
+
+    def _wait_signal(coroutine: Coroutine, signal: Signal) -> None:
+        waiting = TimeHandler._signals.get(signal)
+
+        if waiting is None:
+            waiting = TimeHandler._signals[signal] = []
+
+            # one listener per signal, it stays in the signal (removing it while the signal is triggered would break the trigger)
+            if "TimeHandler.coroutines" not in signal.listeners:
+                signal.add("TimeHandler.coroutines", lambda *args, **kwargs: TimeHandler._wake(signal, args))
+
+        waiting.append(coroutine)
+
+    def _wake(signal: Signal, args: Tuple) -> None:
+        waiting = TimeHandler._signals.pop(signal, None)
+        if not waiting:
+            return
+
+        value = args[0] if len(args) == 1 else (args or None)
+
+        for coroutine in waiting:
+            if coroutine.running:
+                TimeHandler._resume(coroutine, value)
+
+    def get_ticks() -> float:
+        r"""
+        #### Returns the milliseconds of game time (`Clocks.main`, scaled and paused with it)
+        """
+        return Clocks.main.time * 1000
 
     def check():
         r"""
         #### Manages the time events
         """
-        # removing intervals
+        # a frame starts
+        TimeHandler.frame += 1
+
+        if TimeHandler.replay is not None:
+            TimeHandler.replay.next_frame()
+            Clocks.update(TimeHandler.replay.delta_time)
+        else:
+            Clocks.update()
+
+        if TimeHandler.recorder is not None:
+            TimeHandler.recorder.begin_frame(pg.time.get_ticks())
+
+        intervals = TimeHandler.intervals
+        heap = TimeHandler._heap
+        current_time = TimeHandler.get_ticks()
+
+        # removing intervals (their heap entries are dropped when they are reached)
         for target_name in TimeHandler.to_remove:
-            for index, interval in enumerate(TimeHandler.intervals):
-                if interval.name == target_name:
-                    del TimeHandler.intervals[index]
-                    break
+            if intervals.pop(target_name, None) is not None:
+                TimeHandler._stale += 1
 
         TimeHandler.to_remove.clear()
 
-        # adding intervals
-        TimeHandler.intervals.extend(TimeHandler.to_add)
+        for prefix in TimeHandler.to_remove_prefix:
+            for target_name in [name for name in intervals if name.startswith(prefix)]:
+                del intervals[target_name]
+                TimeHandler._stale += 1
+
+        TimeHandler.to_remove_prefix.clear()
+
+        # adding intervals (an interval with the same name is replaced)
+        for interval in TimeHandler.to_add:
+            if interval.name in intervals:
+                TimeHandler._stale += 1
+
+            intervals[interval.name] = interval
+
+            interval.last_call = current_time
+            interval.due = current_time + interval.time
+            heappush(heap, (interval.due, next(TimeHandler._order), interval))
+
         TimeHandler.to_add.clear()
 
-        # Checking  Intervals
-        current_time = pg.time.get_ticks()
-        for interval in TimeHandler.intervals:
-            if current_time - interval.last_call >= interval.time:
+        # most of the heap are cancelled intervals
+        if TimeHandler._stale > 64 and TimeHandler._stale > len(heap) // 2:
+            heap[:] = [
+                entry for entry in heap
+                if (entry[2].running if type(entry[2]) is Coroutine else intervals.get(entry[2].name) is entry[2])
+            ]
+            heapify(heap)
+            TimeHandler._stale = 0
+
+        # Checking  Intervals (only the ones that are due)
+        due = []
+        while heap and heap[0][0] <= current_time:
+            due.append(heappop(heap)[2])
+
+        rescheduled = []
+
+        for interval in due:
+            # waiting coroutine
+            if type(interval) is Coroutine:
+                if interval.running:
+                    TimeHandler._resume(interval, None)
+                continue
+
+            # removed or replaced
+            if intervals.get(interval.name) is not interval:
+                TimeHandler._stale -= 1
+                continue
+
+            calls = 1
+            if interval.fixed and interval.catch_up == "all" and interval.time > 0:
+                calls = int((current_time - interval.due) // interval.time) + 1
+
+            for _ in range(calls):
                 interval.callback()
-                interval.last_call = pg.time.get_ticks()
 
                 # check interval repeats
                 if (
                     interval.repeat > 0
                 ):  # this conditional avoids modifying infinite intervals
                     interval.repeat -= 1
-                    
+
                     # if interval doesnt have to repeat any more, then delete it
                     if interval.repeat == 0:
-                        TimeHandler.to_remove.append(interval.name)
+                        break
+
+            interval.last_call = current_time
+
+            if interval.repeat == 0:
+                del intervals[interval.name]
+                continue
+
+            if not interval.fixed:
+                interval.due = current_time + interval.time
+
+            elif interval.time > 0:
+                # next call of the schedule after the current time
+                missed = (current_time - interval.due) // interval.time + 1
+                interval.due += missed * interval.time
+
+            else:
+                interval.due = current_time
+
+            rescheduled.append(interval)
+
+        # pushed after checking, so intervals with `time = 0` are called once per frame
+        for interval in rescheduled:
+            heappush(heap, (interval.due, next(TimeHandler._order), interval))
+
+        # coroutines waiting for frames
+        frame_heap = TimeHandler._frame_heap
+
+        due = []
+        while frame_heap and frame_heap[0][0] <= TimeHandler.frame:
+            due.append(heappop(frame_heap)[2])
+
+        for coroutine in due:
+            if coroutine.running:
+                TimeHandler._resume(coroutine, None)
 
 
 # time decorators  ------------------------------------------------------------
-def add_interval(time: int, name: str = "Default", repeat: int = -1) -> Callable:
+def add_interval(time: int, name: str = "Default", repeat: int = -1, fixed: bool = False, catch_up: str = "skip") -> Callable:
     r"""
     - Adds an `interval` to the time handler, calls the function every `time`
     - `time` : amount of time in seconds that the event will be called after
     - `name` : name of the interval (Optional)
+    - `fixed` : if True, calls keep a fixed schedule instead of being `time` after the last call (Optional)
+    - `catch_up` : `"skip"` or `"all"`, what a `fixed` interval does when it missed several calls (Optional)
     """
 
     def wrapper(func):
-        TimeHandler.add(time, func, name, repeat)
+        TimeHandler.add(time, func, name, repeat, fixed, catch_up)
         return func
 
     return wrapper
 
 
-def remove_interval(name: str) -> None:
+def remove_interval(name: str, prefix: bool = False) -> None:
     r"""
     #### Removes an `interval` from the time handler
     - `name` : name of the interval
+    - `prefix` : if True, every interval whose name starts with `name` is removed (Optional)
+    """
+    TimeHandler.remove(name, prefix)
+
+
+def start_coroutine(generator: Generator, name: str = "Default") -> Coroutine:
+    r"""
+    #### Runs a coroutine (see `Coroutine`)
+    - `generator` : generator to run
+    - `name` : name of the coroutine (Optional)
+
+    #### Example
+    ```python
+    def intro():
+        yield 0.5
+        spawn_enemy()
+        yield player.on_hit # waits for the signal
+        yield Frames(2)
+        ...
+
+    start_coroutine(intro())
+    ```
+    """
+    return TimeHandler.start_coroutine(generator, name)
+
+
+def stop_coroutine(name: str, prefix: bool = False) -> None:
+    r"""
+    #### Stops a coroutine
+    - `name` : name of the coroutine
+    - `prefix` : if True, every coroutine whose name starts with `name` is stopped (Optional)
     """
-    TimeHandler.remove(name)
+    TimeHandler.stop_coroutine(name, prefix)
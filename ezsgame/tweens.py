@@ -0,0 +1,430 @@
+"""
+Module for tweens (animating numeric properties of objects over time), all the active tweens are advanced
+in a single vectorized step per frame
+"""
+
+from typing import Any, Callable, Dict, List, Tuple
+import numpy as np
+
+from .clock import Clock, Clocks
+from .reactivity import Reactive
+from .styles.colors import resolve_color
+from .types import Signal, Vector2
+
+
+# easing functions, take and return an array of progress values (`0` - `1`)
+def _in_out_quad(t):
+    return np.where(t < 0.5, 2 * t * t, -1 + (4 - 2 * t) * t)
+
+def _in_out_cubic(t):
+    return np.where(t < 0.5, 4 * t ** 3, (t - 1) * (2 * t - 2) ** 2 + 1)
+
+def _out_back(t):
+    c1 = 1.70158
+    return 1 + (c1 + 1) * (t - 1) ** 3 + c1 * (t - 1) ** 2
+
+EASINGS: Dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    "linear": lambda t: t,
+    "in_quad": lambda t: t * t,
+    "out_quad": lambda t: t * (2 - t),
+    "in_out_quad": _in_out_quad,
+    "in_cubic": lambda t: t ** 3,
+    "out_cubic": lambda t: (t - 1) ** 3 + 1,
+    "in_out_cubic": _in_out_cubic,
+    "in_sine": lambda t: 1 - np.cos(t * np.pi / 2),
+    "out_sine": lambda t: np.sin(t * np.pi / 2),
+    "in_out_sine": lambda t: (1 - np.cos(np.pi * t)) / 2,
+    "out_back": _out_back,
+}
+
+_EASING_IDS: Dict[str, int] = {name: i for i, name in enumerate(EASINGS)}
+_EASING_FUNCS: List[Callable] = list(EASINGS.values())
+
+# how the value of a tween is written into its target
+_VECTOR = 0 # `Vector2` (pos, size) modified in place
+_COLOR = 1 # `styles.color` of an object
+_REACTIVE = 2 # `Reactive.set`
+_SCALAR = 3 # numeric attribute
+_TUPLE = 4 # attribute holding a tuple of numbers
+
+
+class Tween:
+    r"""
+    #### Tween
+    Animation of a property from a start value to an end value, created with `Tweens.start` (or `tween`).
+
+    - `on_complete` : signal triggered with the tween when it finishes (not when it's cancelled), coroutines can wait on it
+    - `done` : the tween finished or was cancelled
+    """
+
+    __slots__ = ("target", "prop", "holder", "kind", "size", "start", "end", "on_complete", "done", "_index")
+
+    def __init__(self, target: Any, prop: str | None, holder: Any, kind: int, start: Tuple[float, ...], end: Tuple[float, ...]):
+        self.target = target
+        self.prop: str | None = prop
+        self.holder = holder # object the value is written to
+        self.kind: int = kind
+        self.size: int = len(start)
+
+        self.start: Tuple[float, ...] = start
+        self.end: Tuple[float, ...] = end
+
+        self.on_complete: Signal = Signal()
+        self.done: bool = False
+        self._index: int | None = None
+
+    def cancel(self) -> None:
+        r"""
+        #### Stops the tween where it is (`on_complete` is not triggered)
+        """
+        Tweens._remove(self)
+
+    def __repr__(self) -> str:
+        return f"<Tween: {self.prop or type(self.target).__name__}, {self.start} -> {self.end}, done: {self.done}>"
+
+
+def _as_values(value) -> Tuple[float, ...]:
+    if isinstance(value, Vector2):
+        return (value.x, value.y)
+
+    if isinstance(value, (tuple, list)):
+        return tuple(float(v) for v in value)
+
+    return (float(value),)
+
+
+class Tweens:
+    r"""
+    #### Tweens
+    Runs every active tween: start values, deltas, elapsed time, durations, easing and clock of the tweens are stored in NumPy arrays
+    and advanced together once per frame (after the clocks, see `Clocks.on_update`), then the values are written to the targets.
+
+    - Properties : `pos` and `size` of objects (or any `Vector2`), `color` (of objects), `Reactive` values and numeric attributes
+    - Starting a tween on a property that is already being tweened replaces the running tween
+    - Each tween follows a clock (`"main"` by default), so tweens of paused clocks don't advance
+
+    #### Example
+    ```python
+    t = Tweens.start(rect, "pos", (300, 200), 0.5, easing="out_cubic")
+    Tweens.start(rect, "color", "red", 1, delay=0.5)
+
+    t.on_complete.add("next", lambda tween: ...)
+    ```
+    """
+
+    tweens: List[Tween] = [] # active tweens, in the same order as the arrays
+
+    _capacity: int = 0
+    _start: np.ndarray = np.zeros((0, 4))
+    _delta: np.ndarray = np.zeros((0, 4))
+    _end: np.ndarray = np.zeros((0, 4))
+    _elapsed: np.ndarray = np.zeros(0)
+    _duration: np.ndarray = np.ones(0)
+    _easing: np.ndarray = np.zeros(0, np.int16)
+    _clock: np.ndarray = np.zeros(0, np.int16)
+    _kind: np.ndarray = np.zeros(0, np.int8)
+
+    _easing_counts: Dict[int, int] = {} # easing id -> active tweens using it
+    _kind_counts: Dict[int, int] = {} # kind -> active tweens of that kind
+    _clocks: List[Clock] = []
+    _clock_ids: Dict[str, int] = {}
+    _by_target: Dict[int, Dict[str | None, Tween]] = {} # id(target) -> {prop : tween}
+
+    def start(
+        target: Any,
+        prop: str | None,
+        end: Any,
+        duration: float,
+        easing: str = "linear",
+        delay: float = 0,
+        start: Any = None,
+        clock: str = "main",
+    ) -> Tween:
+        r"""
+        #### Starts a tween and returns it
+        - `target` : object to animate (or a `Reactive` / `Vector2` with `prop = None`)
+        - `prop` : name of the property (`"pos"`, `"size"`, `"color"`, any numeric attribute)
+        - `end` : final value (number, `(x, y)`, color name or rgb)
+        - `duration` : seconds the tween lasts
+        - `easing` : name of the easing function (see `EASINGS`) (Optional)
+        - `delay` : seconds to wait before starting (Optional)
+        - `start` : start value, the current value by default (Optional)
+        - `clock` : name of the clock the tween follows (see `Clocks`) (Optional)
+        """
+        if easing not in _EASING_IDS:
+            raise ValueError(f"Unknown easing \"{easing}\", available easings: {list(EASINGS)}")
+
+        holder, kind, current = Tweens._resolve(target, prop)
+
+        if kind == _COLOR:
+            end = resolve_color(end)
+            start = resolve_color(start) if start is not None else current
+
+        start = _as_values(current if start is None else start)
+        end = _as_values(end)
+
+        if len(start) != len(end) or len(start) > 4:
+            raise ValueError(f"Can't tween {prop or target} from {start} to {end}")
+
+        # a property is animated by one tween at a time
+        running = Tweens._by_target.get(id(target), {}).get(prop)
+        if running is not None:
+            Tweens._remove(running)
+
+        tween = Tween(target, prop, holder, kind, start, end)
+        Tweens._add(tween, duration, _EASING_IDS[easing], delay, Tweens._get_clock_id(clock))
+        return tween
+
+    def cancel(target: Any, prop: str | None = None) -> None:
+        r"""
+        #### Cancels the tweens of an object (only the one of `prop` if passed)
+        """
+        tweens = Tweens._by_target.get(id(target))
+        if not tweens:
+            return
+
+        if prop is None:
+            for tween in list(tweens.values()):
+                Tweens._remove(tween)
+
+        elif prop in tweens:
+            Tweens._remove(tweens[prop])
+
+    def add_easing(name: str, func: Callable[[np.ndarray], np.ndarray]) -> None:
+        r"""
+        #### Adds an easing function, it gets an array of progress values (`0` - `1`) and must return an array of the same shape
+        """
+        if name not in _EASING_IDS:
+            _EASING_IDS[name] = len(_EASING_FUNCS)
+            _EASING_FUNCS.append(func)
+        else:
+            _EASING_FUNCS[_EASING_IDS[name]] = func
+
+        EASINGS[name] = func
+
+    def _resolve(target, prop) -> Tuple[Any, int, Tuple[float, ...]]:
+        # (object the value is written to, kind, current value)
+        if prop is None:
+            if isinstance(target, Reactive):
+                return target, _REACTIVE, _as_values(target.get())
+
+            if isinstance(target, Vector2):
+                return target, _VECTOR, (target.x, target.y)
+
+            raise ValueError(f"A property is needed to tween {target}")
+
+        if prop == "color" and hasattr(target, "styles"):
+            return target.styles, _COLOR, _as_values(resolve_color(target.styles.color))
+
+        value = getattr(target, prop)
+
+        if isinstance(value, Vector2):
+            return value, _VECTOR, (value.x, value.y)
+
+        if isinstance(value, Reactive):
+            return value, _REACTIVE, _as_values(value.get())
+
+        if isinstance(value, (tuple, list)):
+            return target, _TUPLE, _as_values(value)
+
+        return target, _SCALAR, _as_values(value)
+
+    def _get_clock_id(name: str) -> int:
+        clock_id = Tweens._clock_ids.get(name)
+
+        if clock_id is None:
+            clock_id = Tweens._clock_ids[name] = len(Tweens._clocks)
+            Tweens._clocks.append(Clocks.get(name))
+
+        return clock_id
+
+    def _grow() -> None:
+        capacity = max(64, Tweens._capacity * 2)
+        n = len(Tweens.tweens)
+
+        def resized(array, fill=0):
+            new = np.full((capacity,) + array.shape[1:], fill, array.dtype)
+            new[:n] = array[:n]
+            return new
+
+        Tweens._start = resized(Tweens._start)
+        Tweens._delta = resized(Tweens._delta)
+        Tweens._end = resized(Tweens._end)
+        Tweens._elapsed = resized(Tweens._elapsed)
+        Tweens._duration = resized(Tweens._duration, 1)
+        Tweens._easing = resized(Tweens._easing)
+        Tweens._clock = resized(Tweens._clock)
+        Tweens._kind = resized(Tweens._kind)
+        Tweens._capacity = capacity
+
+    def _add(tween: Tween, duration: float, easing: int, delay: float, clock: int) -> None:
+        i = len(Tweens.tweens)
+        if i == Tweens._capacity:
+            Tweens._grow()
+
+        size = tween.size
+        Tweens._start[i] = 0
+        Tweens._end[i] = 0
+        Tweens._start[i, :size] = tween.start
+        Tweens._end[i, :size] = tween.end
+        Tweens._delta[i] = Tweens._end[i] - Tweens._start[i]
+        Tweens._elapsed[i] = -delay
+        Tweens._duration[i] = duration
+        Tweens._easing[i] = easing
+        Tweens._clock[i] = clock
+        Tweens._kind[i] = tween.kind
+
+        tween._index = i
+        Tweens.tweens.append(tween)
+        Tweens._easing_counts[easing] = Tweens._easing_counts.get(easing, 0) + 1
+        Tweens._kind_counts[tween.kind] = Tweens._kind_counts.get(tween.kind, 0) + 1
+        Tweens._by_target.setdefault(id(tween.target), {})[tween.prop] = tween
+
+        # tweens are stepped after the clocks advance
+        if "Tweens" not in Clocks.on_update.listeners:
+            Clocks.on_update.add("Tweens", Tweens.update)
+
+    def _remove(tween: Tween) -> None:
+        i = tween._index
+        if i is None:
+            return
+
+        tweens = Tweens.tweens
+        last = len(tweens) - 1
+
+        easing = int(Tweens._easing[i])
+        Tweens._easing_counts[easing] -= 1
+        Tweens._kind_counts[tween.kind] -= 1
+
+        # the last tween takes the place of the removed one
+        if i != last:
+            moved = tweens[last]
+            tweens[i] = moved
+            moved._index = i
+
+            for array in (
+                Tweens._start, Tweens._delta, Tweens._end, Tweens._elapsed, Tweens._duration, Tweens._easing, Tweens._clock, Tweens._kind
+            ):
+                array[i] = array[last]
+
+        tweens.pop()
+        tween._index = None
+        tween.done = True
+
+        props = Tweens._by_target.get(id(tween.target))
+        if props is not None and props.get(tween.prop) is tween:
+            del props[tween.prop]
+            if not props:
+                del Tweens._by_target[id(tween.target)]
+
+    def update() -> None:
+        r"""
+        #### Advances every tween and writes the values into their targets, called once per frame (`Clocks.on_update`)
+        """
+        n = len(Tweens.tweens)
+        if n == 0:
+            return
+
+        # elapsed time of every tween by its clock
+        deltas = np.fromiter((clock.delta_time for clock in Tweens._clocks), float, len(Tweens._clocks))
+        elapsed = Tweens._elapsed[:n]
+        elapsed += deltas[Tweens._clock[:n]]
+
+        duration = Tweens._duration[:n]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            progress = np.where(duration > 0, elapsed / duration, 1.0)
+        np.clip(progress, 0.0, 1.0, out=progress)
+
+        # easing, one call per easing in use
+        used = [easing for easing, count in Tweens._easing_counts.items() if count]
+        if len(used) == 1:
+            eased = _EASING_FUNCS[used[0]](progress)
+        else:
+            eased = np.empty(n)
+            easings = Tweens._easing[:n]
+
+            for easing in used:
+                mask = easings == easing
+                eased[mask] = _EASING_FUNCS[easing](progress[mask])
+
+        values = Tweens._start[:n] + Tweens._delta[:n] * eased[:, None]
+
+        # finished tweens get their exact end value
+        finished = progress >= 1.0
+        any_finished = finished.any()
+        if any_finished:
+            values[finished] = Tweens._end[:n][finished]
+
+        # values are written by kind, tweens still in their delay are not written
+        started = elapsed >= 0
+        all_started = started.all()
+        tweens = Tweens.tweens
+        kinds = [kind for kind, count in Tweens._kind_counts.items() if count]
+
+        for kind in kinds:
+            if len(kinds) == 1 and all_started:
+                indices = None
+                targets = tweens
+                rows = values
+            else:
+                mask = Tweens._kind[:n] == kind
+                if not all_started:
+                    mask &= started
+
+                indices = np.flatnonzero(mask)
+                if not len(indices):
+                    continue
+
+                targets = [tweens[i] for i in indices.tolist()]
+                rows = values[indices]
+
+            if kind == _VECTOR:
+                for tween, x, y in zip(targets, rows[:, 0].tolist(), rows[:, 1].tolist()):
+                    holder = tween.holder
+                    holder.x = x
+                    holder.y = y
+
+            elif kind == _SCALAR:
+                for tween, value in zip(targets, rows[:, 0].tolist()):
+                    setattr(tween.holder, tween.prop, value)
+
+            elif kind == _COLOR:
+                for tween, value in zip(targets, np.rint(rows).astype(int).tolist()):
+                    tween.holder.color = tuple(value[:tween.size])
+
+            elif kind == _REACTIVE:
+                for tween, value in zip(targets, rows.tolist()):
+                    tween.holder.set(value[0] if tween.size == 1 else tuple(value[:tween.size]))
+
+            else:
+                for tween, value in zip(targets, rows.tolist()):
+                    setattr(tween.holder, tween.prop, tuple(value[:tween.size]))
+
+        if not any_finished:
+            return
+
+        # removed first, so completion listeners can start new tweens on the same properties
+        done = [tweens[i] for i in np.flatnonzero(finished & started).tolist()]
+
+        for tween in done:
+            Tweens._remove(tween)
+
+        for tween in done:
+            if tween.on_complete.listeners:
+                tween.on_complete.trigger(tween)
+
+
+def tween(
+    target: Any,
+    prop: str | None,
+    end: Any,
+    duration: float,
+    easing: str = "linear",
+    delay: float = 0,
+    start: Any = None,
+    clock: str = "main",
+) -> Tween:
+    r"""
+    #### Starts a tween (see `Tweens.start`)
+    """
+    return Tweens.start(target, prop, end, duration, easing, delay, start, clock)
@@ -451,10 +451,16 @@ class ProfilingOptions:
     - `profile` : profiler to use (default: `cProfile.Profile()`)
     - `sort` : profiling results sorting (default: `SortKey.COMULATIVE`)
     - `limit` : number of records to show at the end of profiling
+    - `mode` : `"cprofile"` (instruments every call) or `"sampling"` (samples the stack every `interval` seconds, low overhead)
+    - `interval` : time between samples in seconds (sampling mode)
+    - `collapsed_file` : file where the sampled stacks are written, flamegraph compatible (sampling mode)
     """
     profile: cProfile.Profile = cProfile.Profile()
     sort : SortKey = SortKey.CUMULATIVE
     limit : int = 10
     file : str = "profile.prof"
+    mode : str = "cprofile"
+    interval : float = 0.005
+    collapsed_file : str = "profile.collapsed"
 
 
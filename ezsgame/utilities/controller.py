@@ -1,4 +1,4 @@
-from ..event_handler import on_key, remove_event
+from ..actions import Actions
 from ..world import get_window
 
 
@@ -20,6 +20,8 @@ class Controller:
         - if speed length is 2 -> `[min, max]`
             - Example: `[-10,10]` -> `[-10,10, -10,-10]` left, right, down, up
 
+    Each key is an `Action` (see `Actions`), speeds are set when an action is pressed and reset when it's released,
+    checked once per frame by a single `Actions.on_update` listener.
     """
 
     def __init__(
@@ -29,7 +31,7 @@ class Controller:
         use_delta_time=True,
         auto_complete_speed=True,
     ):
-        self._evnames = []
+        self._actions = []
 
         self.window = get_window()
         self.keys = keys
@@ -56,25 +58,20 @@ class Controller:
         self.speed = [0] * len(self._speeds)
 
         for i in range(len(keys)):
-            self._add_events(i)
+            self._actions.append(Actions.bind(f"Controller.{id(self)}.{i}", keys=[keys[i]]))
 
-    def _add_events(self, index):
-        evname = f"Contoller.keydown.{id(self)}.{index}"
-        self._evnames.append(evname)
+        Actions.on_update.add(f"Controller.{id(self)}", self._update)
 
-        @on_key(type="down", keys=[self.keys[index]], name=evname)
-        def keydown():
-            if self.use_delta_time:
-                self.speed[index] = self._speeds[index] * self.window.get_delta_time()
-            else:
-                self.speed[index] = self._speeds[index]
+    def _update(self):
+        for index, action in enumerate(self._actions):
+            if action.pressed:
+                if self.use_delta_time:
+                    self.speed[index] = self._speeds[index] * self.window.get_delta_time()
+                else:
+                    self.speed[index] = self._speeds[index]
 
-        evname = f"Contoller.keyup.{id(self)}.{index}"
-        self._evnames.append(evname)
-
-        @on_key(type="up", keys=[self.keys[index]], name=evname)
-        def keyup():
-            self.speed[index] = 0
+            elif action.released:
+                self.speed[index] = 0
 
     def get_speed(self, type="all"):
         r"""
@@ -135,8 +132,10 @@ class Controller:
             return
 
     def __del__(self):
-        if self.__dict__.get("_evnames", None):
-            for evname in self._evnames:
-                remove_event(evname)
+        if self.__dict__.get("_actions", None):
+            for action in self._actions:
+                Actions.unbind(action.name)
+
+            Actions.on_update.listeners.pop(f"Controller.{id(self)}", None)
 
         del self
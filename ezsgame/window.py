@@ -1,22 +1,25 @@
-from typing import Callable, Iterable
+from typing import TYPE_CHECKING, Callable, Iterable
+from time import perf_counter
 import pygame as pg, random, os
 
-from .scenes import SceneManager
-from .graphics import Image
 from .styles.units import Measure
 from .types import ProfilingOptions, Size, Pos
 from .styles.colors import Gradient
 from .styles.styles_resolver import resolve_color
 from .world import World
+from .rendering import DirtyRegions
+from .profiling import FrameTimings, SamplingProfiler
+from .pacing import FramePacer
 
 # handlers
 from .event_handler import EventHandler
 from .time_handler import TimeHandler
+from .clock import Clocks
 
 from pstats import SortKey, Stats
 
-
-pg.init()
+if TYPE_CHECKING:
+    from .scenes import SceneManager
 
 
 class Window:
@@ -24,6 +27,16 @@ class Window:
     #### Window
 
     - Profiling: If a `ProfilingOptions` is passed to the `profiling` parameter, the profiling will be enabled.
+    With `mode="sampling"` a `SamplingProfiler` is used instead of `cProfile`, stacks are written to `collapsed_file` on `quit`.
+    - Dirty Rects: If `dirty_rects` is True, only the regions of the screen that changed are presented on `update`.
+    Objects report their changes when drawn, anything drawn by hand should be reported through `mark_dirty`.
+    `show_dirty_rects` outlines the presented regions (debug overlay).
+    - Headless: If `headless` is True, no window is opened, `surface` is an offscreen surface (it can be drawn and read normally)
+    and nothing is presented. Events still work through the SDL dummy video driver. Use `fps=0` to run the clock uncapped.
+    - Frame Timings: If `frame_timings` is True (or the number of frames to keep), the time spent in each phase of the frame is recorded
+    in `window.timings` (see `FrameTimings`).
+    - Frame Pacing: If a `FramePacer` is passed to the `pacing` parameter, it decides how to wait between frames, when drawing can be skipped
+    under load (`window.pacer.render`) and the target fps (see `FramePacer`).
     """
 
     __slots__ = (
@@ -42,6 +55,13 @@ class Window:
         "show_fps",
         "fps",
         "profiling",
+        "dirty_regions",
+        "fixed_delta_time",
+        "alpha",
+        "headless",
+        "timings",
+        "sampler",
+        "pacer",
     )
 
     # check if an istance of Window is created
@@ -83,6 +103,11 @@ class Window:
         fullscreen: bool = False,
         resizable: bool = False,
         profiling: ProfilingOptions = False,
+        dirty_rects: bool = False,
+        show_dirty_rects: bool = False,
+        headless: bool = False,
+        frame_timings: bool | int = False,
+        pacing: FramePacer | None = None,
     ):
         self.size = size if isinstance(size, Size) else Size(*size)
         self.pos = Pos(0, 0)
@@ -96,12 +121,47 @@ class Window:
         self.depth = depth
         self.show_fps = show_fps
         self.profiling = profiling
+        self.headless = headless
+
+        # pygame is initialized when the window is created instead of when ezsgame is imported
+        pg.init()
+        self.dirty_regions = (
+            DirtyRegions(show_dirty_rects)
+            if (dirty_rects or show_dirty_rects) and not headless
+            else None
+        )
+
+        self.timings: FrameTimings | None = None
+        if frame_timings:
+            self.timings = (
+                FrameTimings() if frame_timings is True else FrameTimings(frame_timings)
+            )
+
+        self.pacer: FramePacer | None = pacing
+        if pacing is not None:
+            pacing.set_fps(fps)
+
+        # fixed timestep (see `run`)
+        self.fixed_delta_time: float | None = None
+        self.alpha: float = 1.0
 
         self.load_icon(icon)
 
         # Profiling
+        self.sampler: SamplingProfiler | None = None
+
         if self.profiling:
-            self.profiling.profile.enable()
+            if self.profiling.mode == "sampling":
+                self.sampler = SamplingProfiler(self.profiling.interval)
+                self.sampler.start()
+
+            elif self.profiling.mode == "cprofile":
+                self.profiling.profile.enable()
+
+            else:
+                raise ValueError(
+                    f"Invalid profiling mode: {self.profiling.mode}. Valid modes are: \"cprofile\", \"sampling\""
+                )
 
         # init window and surface
         self._init()
@@ -120,11 +180,27 @@ class Window:
         """
         self.size = size
         self._resolve_size(size)
-        pg.display.set_mode(self.size, pg.RESIZABLE)
+
+        if self.headless:
+            self.surface = pg.Surface(self.size, 0, self.depth)
+        else:
+            pg.display.set_mode(self.size, pg.RESIZABLE)
+
+        # the world view (culling) follows the window size
+        World.size = self.size
+
+        self.mark_dirty()
         return self
 
-    def get_delta_time(self) -> int:
-        return self.clock.get_time() / 1000
+    def get_delta_time(self) -> float:
+        r"""
+        #### Returns the game time (in seconds) the last frame took (`Clocks.main`, scaled and paused with it)
+        Note: when running with a fixed timestep returns the duration of a simulation step
+        """
+        if self.fixed_delta_time is not None:
+            return self.fixed_delta_time
+
+        return Clocks.main.delta_time
 
     def load_icon(self, icon: str):
         r"""
@@ -132,6 +208,11 @@ class Window:
         - `icon` :  path to the icon
         """
         self.icon = icon
+
+        # there is no window to set the icon to
+        if self.headless:
+            return self
+
         if icon == "":
             try:
                 path = os.path.join(
@@ -157,6 +238,22 @@ class Window:
         x = random.randint(-force, force)
         y = random.randint(-force, force)
         self.surface.blit(self.surface, (x, y))
+        self.mark_dirty()
+        return self
+
+    def mark_dirty(self, rect=None):
+        r"""
+        #### Marks a region of the screen as changed (dirty rects mode)
+        - `rect` : region that changed `(x, y, width, height)`, if not passed the whole screen is marked  (Optional)
+        """
+        if self.dirty_regions is None:
+            return self
+
+        if rect is None:
+            self.dirty_regions.invalidate()
+        else:
+            self.dirty_regions.add(rect)
+
         return self
 
     def get_fps(self):
@@ -170,9 +267,21 @@ class Window:
         #### Checks and Manage the events, should be called in the main loop
         """
 
-        # run the checks in different threads to improve performance
+        timings = self.timings
+
+        if timings is None:
+            TimeHandler.check()
+            EventHandler.check()
+            return
+
+        start = perf_counter()
         TimeHandler.check()
+
+        checkpoint = perf_counter()
+        timings.add("time", checkpoint - start)
+
         EventHandler.check()
+        timings.add("events", perf_counter() - checkpoint)
 
     def _resolve_size(self, size: Size):
         if self.fullscreen:
@@ -212,6 +321,9 @@ class Window:
         #### Initializes the window, is called automatically
         """
 
+        if self.headless:
+            return self._init_headless()
+
         self._resolve_size(self.size)
 
         if self.resizable and self.fullscreen:
@@ -234,6 +346,22 @@ class Window:
 
         self.clock = pg.time.Clock()
 
+        # new display, everything has to be presented
+        if self.dirty_regions is not None:
+            self.dirty_regions.invalidate()
+
+    def _init_headless(self):
+        r"""
+        #### Initializes the window without a display, is called automatically
+        """
+        # events and input need the video system, the dummy driver doesn't need a display
+        if not pg.display.get_init():
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            pg.display.init()
+
+        self.surface = pg.Surface(self.size, 0, self.depth)
+        self.clock = pg.time.Clock()
+
     # Property shortcuts
     @property
     def x(self) -> Measure:
@@ -271,33 +399,83 @@ class Window:
         r"""
         #### Updates the Window
         """
+        timings = self.timings
+        if timings is not None:
+            start = perf_counter()
 
-        if self.show_fps:
+        if self.show_fps and not self.headless:
             pg.display.set_caption(
                 f"{self.title}  FPS : " + f"{int(self.clock.get_fps())}"
             )
 
-        pg.display.update()
+        pacer = self.pacer
+
+        # headless windows have nothing to present, and frames whose draw was skipped have nothing new
+        if not self.headless and (pacer is None or pacer.render):
+            if self.dirty_regions is not None:
+                rects = self.dirty_regions.flush(self.surface)
 
-        self.clock.tick(self.fps)
+                if rects is None:
+                    pg.display.update()
+                elif rects:
+                    pg.display.update(rects)
+
+            else:
+                pg.display.update()
+
+        if pacer is None:
+            self.clock.tick(self.fps)
+
+        else:
+            if pacer.max_fps != self.fps:
+                pacer.set_fps(self.fps)
 
-        # Add objects that were added during the update
-        if len(World.objects_to_add) > 0:
-            World.objects.update(World.objects_to_add)
+            pacer.tick(self.clock)
+
+        if timings is not None:
+            checkpoint = perf_counter()
+            timings.add("present", checkpoint - start)
+
+        # Add objects that were added during the update (inserted by z-index)
+        if World.objects_to_add:
+            for obj in World.objects_to_add:
+                World.objects.add(obj)
             World.objects_to_add.clear()
 
-            # sort objects by z-index
-            World.objects = set(sorted(World.objects, key=lambda obj: obj.styles.z_index))
+        # Remove objects that were removed during the update (after adding, objects can be created and removed in the same frame)
+        if World.objects_to_remove:
+            for obj in World.objects_to_remove:
+                World.objects.remove(obj)
+
+                # the region where the object was drawn has to be presented again
+                if self.dirty_regions is not None and obj._draw_state is not None:
+                    self.dirty_regions.add(obj._draw_state[0])
+            World.objects_to_remove.clear()
 
         # call on update events
         World.on_update.trigger()
 
+        if timings is not None:
+            timings.add("on_update", perf_counter() - checkpoint)
+            timings.next_frame()
+
+        if self.sampler is not None:
+            self.sampler.next_frame()
+
     def quit(self):
         r"""
         #### Quits the App  (Ends the window)
         """
+        # flush input recording
+        if TimeHandler.recorder is not None:
+            TimeHandler.recorder.stop()
 
-        if self.profiling:
+        if self.sampler is not None:
+            self.sampler.stop()
+            self.sampler.dump(self.profiling.collapsed_file)
+            print(self.sampler.report(self.profiling.limit))
+
+        elif self.profiling:
             self.profiling.profile.disable()
 
             # save profiling stats
@@ -323,7 +501,14 @@ class Window:
         if size == [0, 0]:
             size = self.size
 
-        if isinstance(color, Gradient) or isinstance(color, Image):
+            if self.dirty_regions is not None:
+                self.dirty_regions.set_background(color)
+
+        elif self.dirty_regions is not None:
+            self.dirty_regions.add((*pos, *size))
+
+        # Gradient, Image or any other drawable (avoids importing graphics module)
+        if isinstance(color, Gradient) or hasattr(color, "draw"):
             color.draw()
 
         else:
@@ -337,8 +522,26 @@ class Window:
         self.fullscreen = not self.fullscreen
         self._init()
 
+        # the world view (culling) follows the window size
+        World.size = self.size
+
     # Scenes
-    def run_scenes(self, scene_manager: SceneManager):
+    def run_scenes(self, scene_manager: "SceneManager", tick_rate: int | None = None, max_steps: int = 5):
+        r"""
+        #### Runs the scenes of a `SceneManager` as the main loop
+        - `scene_manager` : scene manager to run
+        - `tick_rate` : if passed, scenes are updated `tick_rate` times per second independently of the fps (see `run`). Scenes can read `window.alpha` while drawing  (Optional)
+        - `max_steps` : max number of updates per frame when running with a `tick_rate`  (Optional)
+        """
+        if tick_rate:
+            return self._run_fixed(
+                scene_manager.update,
+                lambda alpha: scene_manager.draw(),
+                False,
+                tick_rate,
+                max_steps,
+            )
+
         # Main loop
         while True:
             self.check_events()
@@ -349,20 +552,108 @@ class Window:
             self.update()
 
     # Shortcut: Running, avoid the having to write boilerplate code as "screen.check_events() screen.update()"
-    def run(self, func: Callable, auto_draw: bool = True):
+    def run(
+        self,
+        func: Callable,
+        auto_draw: bool = True,
+        draw: Callable[[float], None] | None = None,
+        tick_rate: int | None = None,
+        max_steps: int = 5,
+    ):
         r"""
         #### Runs a function as the main loop
         - `func` : function to be runned
-        - `auto_draw` : if True, all objects will be drawn automatically, ordered by declaration order. Will be called after `func`  (Optional)
+        - `auto_draw` : if True, all objects will be drawn automatically, ordered by z-index and declaration order, objects outside of the world view are skipped (see `World.culling`). Will be called after `func`  (Optional)
+        - `draw` : function called once per frame before `auto_draw`, receives the interpolation alpha (see `tick_rate`)  (Optional)
+        - `tick_rate` : if passed, `func` is used as a fixed timestep update and is called `tick_rate` times per second,
+        no matter the fps. `get_delta_time` returns `1 / tick_rate` and `draw` receives how far (`0` to `1`) the current frame is
+        between the last update and the next one, to interpolate positions  (Optional)
+        - `max_steps` : max number of updates per frame, if the game can't keep up the remaining time is dropped
+        instead of piling up updates (spiral of death)  (Optional)
 
         Note: `check_events()` and `update()` are called automatically and the start and end of the function respectively
         """
+        if tick_rate:
+            return self._run_fixed(func, draw, auto_draw, tick_rate, max_steps)
+
+        timings = self.timings
+
         while True:
             self.check_events()
+
+            if timings is not None:
+                start = perf_counter()
+
             func()
 
-            if auto_draw:
-                for obj in World.objects:
-                    obj.draw()
+            if timings is not None:
+                checkpoint = perf_counter()
+                timings.add("update", checkpoint - start)
+
+            if self.pacer is None or self.pacer.render:
+                if draw:
+                    draw(1.0)
+
+                if auto_draw:
+                    World.draw()
+
+            if timings is not None:
+                timings.add("draw", perf_counter() - checkpoint)
+
+            self.update()
+
+    def _run_fixed(
+        self,
+        update: Callable,
+        draw: Callable[[float], None] | None,
+        auto_draw: bool,
+        tick_rate: int,
+        max_steps: int,
+    ):
+        r"""
+        #### Main loop with a fixed simulation timestep
+        Game time (`Clocks.main`) is accumulated and consumed in steps of `1 / tick_rate` seconds.
+        """
+        step = 1 / tick_rate
+        self.fixed_delta_time = step
+
+        timings = self.timings
+
+        accumulator = 0.0
+
+        while True:
+            self.check_events()
+
+            # game time of the frame (recorded while replaying, scaled, zero while paused)
+            accumulator += Clocks.main.delta_time
+
+            if timings is not None:
+                start = perf_counter()
+
+            steps = 0
+            while accumulator >= step and steps < max_steps:
+                update()
+                accumulator -= step
+                steps += 1
+
+            if timings is not None:
+                checkpoint = perf_counter()
+                timings.add("update", checkpoint - start)
+
+            # can't keep up, drop the time left instead of trying to catch up next frame
+            if accumulator >= step:
+                accumulator %= step
+
+            self.alpha = accumulator / step
+
+            if self.pacer is None or self.pacer.render:
+                if draw:
+                    draw(self.alpha)
+
+                if auto_draw:
+                    World.draw()
+
+            if timings is not None:
+                timings.add("draw", perf_counter() - checkpoint)
 
             self.update()
@@ -1,6 +1,7 @@
 from functools import lru_cache
-from typing import Set
+from typing import List, Tuple
 from .types import Pos, Size, Signal
+from .rendering import RenderLayer, RenderList
 
 
 class World:
@@ -18,11 +19,69 @@ class World:
     EventHandler = object
     TimeHandler = object
 
-    objects: Set = set()
-    objects_to_add: Set = set() # avoids iteration errors (adding objects during iteration)
+    # objects outside of the view (+ margin) are not drawn by `World.draw`
+    culling: bool = True
+    cull_margin: float = 0
+
+    objects: RenderList = RenderList() # objects in render order (z-index)
+    objects_to_add: List = [] # avoids iteration errors (adding objects during iteration)
+    objects_to_remove: List = []
 
     on_update: Signal = Signal()
     
+    @classmethod
+    def get_view(cls, margin: float = 0) -> Tuple[float, float, float, float]:
+        """
+        #### Returns the view of the world as `(left, top, right, bottom)`
+        - `margin` : extra space added to each side of the view (Optional)
+        """
+        return (
+            cls.pos[0] - margin,
+            cls.pos[1] - margin,
+            cls.pos[0] + cls.size[0] + margin,
+            cls.pos[1] + cls.size[1] + margin,
+        )
+
+    @classmethod
+    def draw(cls) -> None:
+        """
+        #### Draws all the objects of the world by z-index, objects outside of the view are skipped (if `culling` is enabled)
+        """
+        cls.objects.draw(
+            cls.window.surface, cls.get_view(cls.cull_margin) if cls.culling else None
+        )
+
+    @classmethod
+    def add_layer(cls, name: str, static: bool = False, watch: bool = True) -> RenderLayer:
+        """
+        #### Creates a render layer, objects are added to it through the `layer` style
+        - `name` : name of the layer
+        - `static` : if True, the layer objects are drawn once into a surface that is reused until they change (see `RenderLayer`)
+        - `watch` : if False, static layers only get redrawn when `invalidate` is called or objects join/leave the layer (Optional)
+
+        #### Example
+        ```python
+        World.add_layer("background", static=True)
+        Rect(Pos(0, 0), Size(50, 50), layer="background")
+        ```
+        """
+        return cls.objects.add_layer(name, static, watch)
+
+    @classmethod
+    def get_layer(cls, name: str) -> RenderLayer:
+        """
+        #### Returns a render layer by its name
+        """
+        return cls.objects.layers[name]
+
+    @classmethod
+    def remove(cls, obj) -> None:
+        """
+        #### Removes `obj` from the world, it won't be drawn automatically anymore
+        Note: the object is removed at the end of the current frame
+        """
+        cls.objects_to_remove.append(obj)
+
     @classmethod
     def is_inside(cls, obj) -> bool:
         """